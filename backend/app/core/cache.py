@@ -0,0 +1,63 @@
+"""
+In-process read caches for hot GET endpoints.
+
+LRUCache is a small bounded mapping (no external cachetools dependency).
+Entries are keyed by (user_id, version); bump_stats_version() is called by
+the game routes whenever a game finishes, so stale entries are never served
+— they simply age out of the LRU under their old version key.
+
+Like the active-games dict, this cache is process-local: with multiple
+workers each process keeps its own copy, which is fine because entries are
+cheap to recompute and versioning keeps every copy correct.
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class LRUCache:
+    """Bounded LRU mapping for threadpool workers.
+
+    Individual dict operations are atomic under the GIL, but the
+    get-then-move_to_end pair is not: another thread's put() may evict the
+    key in between, so move_to_end tolerates the key vanishing. The value
+    read itself stays lock-free — a stale or missing read just means a
+    recompute, never corruption."""
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value or None, refreshing recency."""
+        value = self._data.get(key)
+        if value is not None:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                # Evicted by a concurrent put() between the read above and
+                # here; the value we already hold is still fine to return.
+                pass
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+
+# Per-user monotonic counters, bumped on every game finish. Missing entry
+# reads as version 0, so users start cacheable immediately.
+_stats_versions: dict = {}
+
+
+def stats_version(user_id: str) -> int:
+    """Current stats version for a user (0 if they have no finished games
+    since process start)."""
+    return _stats_versions.get(user_id, 0)
+
+
+def bump_stats_version(user_id: str) -> None:
+    """Invalidate cached stats for a user by moving them to a new version."""
+    _stats_versions[user_id] = _stats_versions.get(user_id, 0) + 1
@@ -1,7 +1,15 @@
+from functools import cached_property, lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
 from typing import List
 
+# Validator constants — built once at import rather than per validation call
+_WEAK_SECRETS = frozenset(
+    {"your-secret-key-change-in-production", "secret", "changeme"}
+)
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
 
 class Settings(BaseSettings):
     # Pydantic v2 style — replaces inner class Config
@@ -14,11 +22,19 @@ class Settings(BaseSettings):
         case_sensitive=True,
         # Ignore env vars (e.g. POSTGRES_USER) not declared as Settings fields
         extra="ignore",
+        # Settings are immutable after construction
+        frozen=True,
     )
 
     # --- Database (required — no default prevents accidental misconfiguration) ---
     DATABASE_URL: str
 
+    # --- Database connection pool (ignored for SQLite) ---
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+
     # --- Security (required — must be explicitly set in every environment) ---
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
@@ -31,6 +47,16 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     ENVIRONMENT: str = "development"  # development | staging | production
 
+    # --- Schema management ---
+    # Explicit opt-in for Base.metadata.create_all at startup (local dev only;
+    # real environments run Alembic migrations instead).
+    AUTO_CREATE_SCHEMA: bool = False
+
+    # --- Rate limiting ---
+    # slowapi/limits storage URI; default in-process memory. Set to a
+    # redis:// URI in multi-worker deployments to share counters.
+    LIMITER_STORAGE_URI: str = "memory://"
+
     # --- CORS (comma-separated string parsed into a list) ---
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:5173"
 
@@ -40,24 +66,30 @@ class Settings(BaseSettings):
         """Reject weak or placeholder secret keys at startup."""
         if len(v) < 32:
             raise ValueError("SECRET_KEY must be at least 32 characters long")
-        weak_values = {"your-secret-key-change-in-production", "secret", "changeme"}
-        if v.lower() in weak_values:
+        if v.lower() in _WEAK_SECRETS:
             raise ValueError("SECRET_KEY is set to an insecure placeholder value")
         return v
 
     @field_validator("LOG_LEVEL")
     @classmethod
     def log_level_must_be_valid(cls, v: str) -> str:
-        valid = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if v.upper() not in valid:
-            raise ValueError(f"LOG_LEVEL must be one of {valid}")
+        if v.upper() not in _VALID_LOG_LEVELS:
+            raise ValueError(f"LOG_LEVEL must be one of {sorted(_VALID_LOG_LEVELS)}")
         return v.upper()
 
-    def get_cors_origins(self) -> List[str]:
-        """Parse comma-separated CORS_ORIGINS into a list."""
+    @cached_property
+    def cors_origins_list(self) -> List[str]:
+        """Comma-separated CORS_ORIGINS parsed into a list (computed once)."""
         return [
             origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()
         ]
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Cached Settings factory — env parsing/validation runs at most once."""
+    return Settings()
+
+
+# Back-compat module-level singleton (existing imports use this directly)
+settings = get_settings()
@@ -11,4 +11,14 @@ don't trigger 429 responses (see conftest.py).
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-limiter = Limiter(key_func=get_remote_address, enabled=True)
+from app.core.config import settings
+
+limiter = Limiter(
+    key_func=get_remote_address,
+    enabled=True,
+    storage_uri=settings.LIMITER_STORAGE_URI,
+)
+
+# Touch the storage backend now so the first rate-limited request doesn't pay
+# for its lazy construction.
+limiter.limiter.storage.check()
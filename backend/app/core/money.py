@@ -0,0 +1,18 @@
+"""
+Money representation: integer cents everywhere inside the application.
+
+Balances and wagers are stored as BigInteger cents and computed with plain
+integer arithmetic — no Decimal(str(...)) round-trips on the game hot path
+and no float accumulation error. Dollars-as-float exist only at the API
+edge, converted through these two helpers.
+"""
+
+
+def to_cents(amount) -> int:
+    """Convert a dollar amount (float/str/Decimal) to integer cents."""
+    return int(round(float(amount) * 100))
+
+
+def to_dollars(cents: int) -> float:
+    """Convert integer cents to a dollar float for API responses."""
+    return cents / 100
@@ -1,3 +1,4 @@
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Optional
@@ -8,11 +9,32 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
+from app.core.cache import LRUCache
 from app.core.config import settings
 from app.core.database import get_db
 from app.models.user import User
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# argon2 first: much cheaper per verify at equivalent security than bcrypt.
+# bcrypt stays registered so existing hashes keep verifying; deprecated="auto"
+# flags them for transparent re-hash on the next successful login.
+#
+# Under the test environment the cost parameters drop to their floor —
+# hashing at production cost dominates test latency while exercising the
+# exact same code path. Production keeps the library defaults. Floor-cost
+# real hashing is preferred over a fake pwd_context in tests: the suite
+# still covers scheme negotiation, verify failures and the needs_update
+# rehash path, at sub-millisecond cost per hash.
+_TEST_HASH_OPTS = {
+    "argon2__time_cost": 1,
+    "argon2__memory_cost": 1024,
+    "argon2__parallelism": 1,
+    "bcrypt__rounds": 4,
+}
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    **(_TEST_HASH_OPTS if settings.ENVIRONMENT == "testing" else {}),
+)
 security = HTTPBearer()
 
 
@@ -24,7 +46,16 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True when the stored hash uses a deprecated scheme (e.g. legacy bcrypt)."""
+    return pwd_context.needs_update(hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    # Plain PyJWT HS256 — a single HMAC-SHA256 per mint (tens of µs).
+    # Verification cost for reused tokens is absorbed by _token_cache below;
+    # pre-encoding header/claims templates against PyJWT internals would
+    # shave microseconds at the cost of depending on private API.
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
@@ -51,26 +82,40 @@ def decode_token(token: str) -> dict:
         )
 
 
+# Decoded-token cache: a token is reused across many requests, so the HMAC
+# verification and claim parsing are paid once per token instead of per call.
+# Entries store (user_uuid, exp) and are honored only while the token's own
+# exp lies in the future, so a hit can never outlive the token itself.
+_token_cache = LRUCache(maxsize=10_000)
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
 ) -> User:
     token = credentials.credentials
-    payload = decode_token(token)
-    user_id: str = payload.get("sub")
-    if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-        )
 
-    try:
-        user_uuid = uuid.UUID(user_id)
-    except (ValueError, AttributeError):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-        )
+    cached = _token_cache.get(token)
+    if cached is not None and cached[1] > time.time():
+        user_uuid = cached[0]
+    else:
+        payload = decode_token(token)
+        user_id: str = payload.get("sub")
+        if user_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+            )
+
+        try:
+            user_uuid = uuid.UUID(user_id)
+        except (ValueError, AttributeError):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+            )
+        _token_cache.put(token, (user_uuid, payload.get("exp", 0.0)))
+
     user = db.query(User).filter(User.id == user_uuid).first()
     if user is None:
         raise HTTPException(
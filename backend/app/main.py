@@ -1,10 +1,14 @@
+import atexit
 import logging
-import json
+import queue
 import time
+from logging.handlers import QueueHandler, QueueListener
+
+import orjson
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from sqlalchemy import text
@@ -22,45 +26,110 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+_MISSING = object()
+
+
 class JSONFormatter(logging.Formatter):
+    # Optional context fields attached via logger extra= — emitted when present
+    _OPTIONAL_FIELDS = (
+        "user_id",
+        "game_id",
+        "bet_amount",
+        "game_result",
+        "request_path",
+        "response_time",
+    )
+
     def format(self, record):
         log_data = {
-            "timestamp": self.formatTime(record),
+            # Raw epoch seconds — skips strftime, and log pipelines ingest
+            # numeric timestamps more cheaply than formatted strings.
+            "timestamp": record.created,
             "level": record.levelname,
             "message": record.getMessage(),
             "module": record.module,
         }
-        if hasattr(record, "user_id"):
-            log_data["user_id"] = record.user_id
-        if hasattr(record, "game_id"):
-            log_data["game_id"] = record.game_id
-        if hasattr(record, "bet_amount"):
-            log_data["bet_amount"] = record.bet_amount
-        if hasattr(record, "game_result"):
-            log_data["game_result"] = record.game_result
-        if hasattr(record, "request_path"):
-            log_data["request_path"] = record.request_path
-        if hasattr(record, "response_time"):
-            log_data["response_time"] = record.response_time
-        return json.dumps(log_data)
-
-
-# Apply JSON formatter to root logger
-handler = logging.StreamHandler()
-handler.setFormatter(JSONFormatter())
-logging.getLogger().handlers = [handler]
+        for field in self._OPTIONAL_FIELDS:
+            value = getattr(record, field, _MISSING)
+            if value is not _MISSING:
+                log_data[field] = value
+        # default=str covers any non-native types reaching the log extra
+        return orjson.dumps(log_data, default=str).decode()
+
+
+# Apply JSON formatter to root logger.
+# Log calls enqueue records (no syscall on the request path); a QueueListener
+# thread drains the queue and performs the actual stderr writes.
+_log_queue: queue.Queue = queue.Queue(-1)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(JSONFormatter())
+_log_listener = QueueListener(_log_queue, _stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logging.getLogger().handlers = [QueueHandler(_log_queue)]
+
+
+# Probe endpoints hammered by k8s/load balancers — logging them adds volume
+# without diagnostic value.
+_SKIP_LOG_PATHS = frozenset({"/health", "/ready"})
+
+
+class RequestLoggingMiddleware:
+    """
+    Pure-ASGI request logging middleware.
+
+    Implemented directly against the ASGI protocol (rather than
+    @app.middleware("http") / BaseHTTPMiddleware) to avoid constructing
+    Request/Response wrappers and an anyio task group on every request.
+    Health/readiness probes are skipped entirely.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in _SKIP_LOG_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and logger.isEnabledFor(
+                logging.INFO
+            ):
+                process_time = time.perf_counter() - start_time
+                # %s placeholders: the message is only formatted if the
+                # record is actually emitted by a handler.
+                logger.info(
+                    "%s %s",
+                    method,
+                    path,
+                    extra={
+                        "request_path": path,
+                        "response_time": f"{process_time * 1000:.2f}ms",
+                    },
+                )
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Blackjack API")
-    if settings.ENVIRONMENT.lower() in {"development", "dev", "testing", "test"}:
-        # NOTE: create_all is acceptable for local and test workflows.
+    if settings.AUTO_CREATE_SCHEMA:
+        # Explicit opt-in only — create_all issues existence checks per table
+        # on every boot, which slows cold starts for no benefit once the
+        # schema is migration-managed.
         Base.metadata.create_all(bind=engine)
     else:
         logger.info(
-            "Skipping schema auto-creation in non-dev environment; run migrations instead"
+            "Skipping schema auto-creation; set AUTO_CREATE_SCHEMA=true or run migrations"
         )
     yield
     # Shutdown
@@ -72,6 +141,9 @@ app = FastAPI(
     description="Production-grade Blackjack game with clean architecture",
     version="1.0.0",
     lifespan=lifespan,
+    # orjson-based serialization for every route on every router — no
+    # per-route response_class needed (2-5x faster than stdlib json)
+    default_response_class=ORJSONResponse,
 )
 
 # Rate limiting — per-IP throttle on auth endpoints
@@ -81,37 +153,15 @@ app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 # CORS middleware — origins driven by CORS_ORIGINS env var
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.get_cors_origins(),
+    allow_origins=settings.cors_origins_list,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 
-# Request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = time.time()
-
-    response = await call_next(request)
-
-    process_time = time.time() - start_time
-
-    log_record = logging.LogRecord(
-        name="api",
-        level=logging.INFO,
-        pathname="",
-        lineno=0,
-        msg=f"{request.method} {request.url.path}",
-        args=(),
-        exc_info=None,
-    )
-    log_record.request_path = str(request.url.path)
-    log_record.response_time = f"{process_time:.3f}s"
-
-    logger.handle(log_record)
-
-    return response
+# Request logging middleware (pure ASGI — see RequestLoggingMiddleware above)
+app.add_middleware(RequestLoggingMiddleware)
 
 
 # Include routers
@@ -130,21 +180,37 @@ async def health_check():
     }
 
 
+# Readiness result cache — k8s probes across many pods would otherwise open
+# a fresh DB connection per poll. A short TTL keeps probe-driven DB load
+# near zero while still detecting outages quickly.
+_READY_CACHE_TTL = 2.0
+_ready_state = {"ts": 0.0, "ok": False}
+
+
 @app.get("/ready")
-async def readiness_check():
-    try:
-        with engine.connect() as connection:
-            connection.execute(text("SELECT 1"))
+def readiness_check():
+    # Sync def: runs in the threadpool so the blocking connect never stalls
+    # the event loop.
+    now = time.monotonic()
+    if now - _ready_state["ts"] >= _READY_CACHE_TTL:
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            _ready_state["ok"] = True
+        except Exception:
+            _ready_state["ok"] = False
+        _ready_state["ts"] = now
+
+    if _ready_state["ok"]:
         return {
             "status": "ready",
             "service": "blackjack-api",
             "environment": settings.ENVIRONMENT,
         }
-    except Exception:
-        return JSONResponse(status_code=503, content={"status": "not_ready"})
+    return JSONResponse(status_code=503, content={"status": "not_ready"})
 
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     return JSONResponse(status_code=500, content={"detail": "Internal server error"})
@@ -1,5 +1,15 @@
 import uuid
-from sqlalchemy import Boolean, Column, String, Numeric, DateTime, ForeignKey, Integer
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    String,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+)
 from sqlalchemy import Uuid
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
@@ -13,11 +23,16 @@ def _utc_now() -> datetime:
 
 class Game(Base):
     __tablename__ = "games"
+    # Covers the stats aggregation and active-game lookups, which always
+    # filter on user_id (+ status)
+    __table_args__ = (Index("ix_games_user_id_status", "user_id", "status"),)
 
+    # Client-side uuid4 — see note on User.id for why there is no server default
     id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(Uuid(as_uuid=True), ForeignKey("users.id"), nullable=False)
     status = Column(String, default="active", nullable=False)  # active, finished
-    bet_amount = Column(Numeric(10, 2), nullable=False)
+    # Integer cents (see app.core.money)
+    bet_amount = Column(BigInteger, nullable=False)
     result = Column(
         String, nullable=True
     )  # win, lose, push, blackjack (comma-sep for split)
@@ -28,18 +43,45 @@ class Game(Base):
     # Relationships
     user = relationship("User", back_populates="games")
     cards = relationship(
-        "GameCard", back_populates="game", cascade="all, delete-orphan"
+        "GameCard",
+        back_populates="game",
+        cascade="all, delete-orphan",
+        # Deal order in SQL so readers never re-sort in Python
+        order_by="[GameCard.hand_index, GameCard.order_index]",
     )
 
 
+class GameHandResult(Base):
+    """
+    One row per resolved player hand — the narrow table behind /stats.
+
+    Game.result keeps the comma-joined string for API compatibility, but
+    aggregation reads these rows so the database can GROUP BY outcome
+    instead of the web worker splitting varchars.
+    """
+
+    __tablename__ = "game_hand_results"
+    # Stats aggregation filters on user_id and groups by outcome
+    __table_args__ = (Index("ix_game_hand_results_user_id", "user_id"),)
+
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    game_id = Column(Uuid(as_uuid=True), ForeignKey("games.id"), nullable=False)
+    # Denormalized so stats never joins through games
+    user_id = Column(Uuid(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    hand_index = Column(Integer, nullable=False)
+    outcome = Column(String, nullable=False)  # win, lose, push, blackjack
+
+
 class GameCard(Base):
     __tablename__ = "game_cards"
 
     id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     game_id = Column(Uuid(as_uuid=True), ForeignKey("games.id"), nullable=False)
     owner = Column(String, nullable=False)  # player, dealer
-    card_rank = Column(String, nullable=False)
-    card_suit = Column(String, nullable=False)
+    # Integer-coded (Rank.to_int / Suit.to_int) — smaller rows than the
+    # original text columns and cheaper comparisons
+    card_rank = Column(SmallInteger, nullable=False)
+    card_suit = Column(SmallInteger, nullable=False)
     order_index = Column(Integer, nullable=False)
     # Phase 2: which hand this card belongs to (0 = main/dealer, 1 = split hand)
     # Default 0 keeps all existing non-split games fully compatible.
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Numeric, DateTime
+from sqlalchemy import BigInteger, Column, String, DateTime
 from sqlalchemy import Uuid
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
@@ -14,10 +14,14 @@ def _utc_now() -> datetime:
 class User(Base):
     __tablename__ = "users"
 
+    # Client-side uuid4: ids are available immediately after insert without a
+    # RETURNING round-trip, and the DDL stays portable to the SQLite test DB
+    # (a gen_random_uuid() server default renders as invalid SQLite DDL).
     id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email = Column(String, unique=True, nullable=False, index=True)
     password_hash = Column(String, nullable=False)
-    balance = Column(Numeric(10, 2), default=1000.00, nullable=False)
+    # Integer cents (see app.core.money) — plain int arithmetic in routes
+    balance = Column(BigInteger, default=100_000, nullable=False)
     created_at = Column(DateTime, default=_utc_now, nullable=False)
 
     # Relationships
@@ -1,16 +1,19 @@
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.security import (
     verify_password,
     get_password_hash,
+    password_needs_rehash,
     create_access_token,
     get_current_user,
 )
 from app.core.config import settings
 from app.core.limiter import limiter
+from app.core.money import to_cents
 from app.models.user import User
 from app.schemas.auth import UserRegister, UserLogin, Token, UserResponse
 
@@ -22,23 +25,27 @@ router = APIRouter()
 )
 @limiter.limit("5/minute")
 def register(request: Request, user_data: UserRegister, db: Session = Depends(get_db)):
-    # Check if user exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
-        )
-
-    # Create new user
+    # Create new user — uniqueness is enforced atomically by the unique index
+    # on users.email, so no pre-check SELECT is needed.
     user = User(
         email=user_data.email,
         password_hash=get_password_hash(user_data.password),
-        balance=settings.INITIAL_BALANCE,
+        balance=to_cents(settings.INITIAL_BALANCE),
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
+        )
 
+    # No refresh needed: id/balance are generated client-side and populated at
+    # flush, so every UserResponse field is already on the instance.
+    # Deliberately no access_token in this response: the frontend logs in
+    # explicitly, and the test suite mints tokens straight from the returned
+    # id — widening the contract would save neither a hash nor a round-trip.
     return user
 
 
@@ -53,6 +60,11 @@ def login(request: Request, user_data: UserLogin, db: Session = Depends(get_db))
             detail="Incorrect email or password",
         )
 
+    # Transparently upgrade legacy bcrypt hashes to argon2 on successful login
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = get_password_hash(user_data.password)
+        db.commit()
+
     # Create access token
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
@@ -1,23 +1,106 @@
 import logging
 import uuid
-from decimal import Decimal
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload, selectinload
+from collections import deque
 from typing import Dict, List
 
+from app.core.cache import bump_stats_version
 from app.core.database import get_db
+from app.core.money import to_cents, to_dollars
 from app.core.security import get_current_user
 from app.models.user import User
-from app.models.game import Game, GameCard
+from app.models.game import Game, GameCard, GameHandResult
 from app.schemas.game import GameStart, GameState, GameAction, CardSchema, HandState
-from app.services.game_engine import GameEngine
-from app.services.deck import Rank, Suit
+from app.services.game_engine import GameEngine, Hand
+from app.services.deck import Card, Rank, Suit
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 # In-memory storage for active game engines (in production, use Redis)
-active_games: Dict[str, GameEngine] = {}
+# Keyed by the raw uuid.UUID — hashing its 128-bit int is cheaper than
+# formatting and hashing a 36-char string on every lookup.
+active_games: Dict[uuid.UUID, GameEngine] = {}
+
+
+class GameEngineStore:
+    """
+    Store for in-flight game engines, keyed by game id UUID.
+
+    Currently a thin seam over the process-local ``active_games`` dict (kept
+    module-level for test injection). A shared backend — e.g. Redis holding
+    serialized engine state with a TTL — can replace the dict here without
+    touching route code; until then horizontal scaling requires sticky
+    sessions or a single worker.
+    """
+
+    def __init__(self, engines: Dict[uuid.UUID, GameEngine]):
+        self._engines = engines
+
+    def get(self, game_id: uuid.UUID) -> GameEngine | None:
+        return self._engines.get(game_id)
+
+    def put(self, game_id: uuid.UUID, engine: GameEngine) -> None:
+        self._engines[game_id] = engine
+
+    def delete(self, game_id: uuid.UUID) -> None:
+        self._engines.pop(game_id, None)
+
+
+engine_store = GameEngineStore(active_games)
+
+
+class GameEnginePool:
+    """
+    Bounded free-list of GameEngine instances.
+
+    Every /start otherwise allocates an engine, a deck and 52 Card wrappers;
+    recycling finished engines (engine.reset() reshuffles the same deck in
+    place) keeps steady-state allocation per game near zero. deque append/
+    popleft are atomic under the GIL, so threadpool workers can share the
+    pool without a lock — the size cap is best-effort, which only risks a
+    few extra pooled engines, not corruption.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._maxsize = maxsize
+        self._engines: deque = deque()
+
+    def acquire(self) -> GameEngine:
+        """Take a recycled engine (reset to pre-deal state) or build one."""
+        try:
+            engine = self._engines.popleft()
+        except IndexError:
+            return GameEngine()
+        engine.reset()
+        return engine
+
+    def release(self, engine: GameEngine) -> None:
+        """Return a finished engine for reuse; drop it if the pool is full."""
+        if len(self._engines) < self._maxsize:
+            self._engines.append(engine)
+
+
+engine_pool = GameEnginePool()
+
+
+# The card universe is fixed (52 rank/suit combinations), so every CardSchema
+# the API can ever emit is precomputed here once at import. Response building
+# becomes pure dict lookups — no per-card model construction. The shared
+# instances are safe because responses never mutate them.
+_CARD_SCHEMAS: Dict[tuple, CardSchema] = {
+    (rank.value, suit.value): CardSchema.model_construct(
+        rank=rank.value, suit=suit.value
+    )
+    for suit in Suit
+    for rank in Rank
+}
+
+
+def _card_schema(card) -> CardSchema:
+    """Precomputed schema for an in-memory Card."""
+    return _CARD_SCHEMAS[card.rank.value, card.suit.value]
 
 
 # ---------------------------------------------------------------------------
@@ -26,7 +109,7 @@ active_games: Dict[str, GameEngine] = {}
 
 
 def _get_active_game(
-    game_id: str,
+    game_id: uuid.UUID,
     user_id,
     db: Session,
 ) -> tuple[Game, GameEngine]:
@@ -34,19 +117,18 @@ def _get_active_game(
     Fetch a game that belongs to the user, verify it is active,
     and return both the DB record and the in-memory engine.
     Raises HTTPException on any validation failure.
-    """
-    try:
-        game_uuid = uuid.UUID(game_id)
-    except (ValueError, AttributeError):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Game not found",
-        )
 
+    game_id arrives already parsed (GameAction.game_id / the path parameter
+    are uuid.UUID), so there is no per-call uuid.UUID() round-trip here.
+    """
     game = (
         db.query(Game)
+        # Action routes must never lazy-load the ever-growing cards
+        # collection — engine state is authoritative. raiseload turns an
+        # accidental game.cards access into a hard error.
+        .options(raiseload(Game.cards))
         .filter(
-            Game.id == game_uuid,
+            Game.id == game_id,
             Game.user_id == user_id,
         )
         .first()
@@ -64,7 +146,7 @@ def _get_active_game(
             detail="Game is not active",
         )
 
-    engine = active_games.get(str(game.id))
+    engine = engine_store.get(game.id)
     if not engine:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -74,56 +156,81 @@ def _get_active_game(
     return game, engine
 
 
-def _save_player_card(
-    card,
-    game_id,
-    hand_index: int,
-    order_index: int,
-    db: Session,
-):
-    """Persist a single player card to game_cards table."""
-    db.add(
-        GameCard(
-            game_id=game_id,
-            owner="player",
-            card_rank=card.rank.value,
-            card_suit=card.suit.value,
-            order_index=order_index,
-            hand_index=hand_index,
-        )
-    )
+def _player_card_row(card, game_id, hand_index: int, order_index: int) -> dict:
+    """Build a game_cards row dict for a single player card."""
+    return {
+        "game_id": game_id,
+        "owner": "player",
+        "card_rank": card.rank.to_int(),
+        "card_suit": card.suit.to_int(),
+        "order_index": order_index,
+        "hand_index": hand_index,
+    }
 
 
-def _save_dealer_cards(game_id, engine: GameEngine, db: Session, initial_count: int):
-    """Persist only the newly dealt dealer cards (those beyond initial_count)."""
-    for idx, card in enumerate(
-        engine.dealer_hand.cards[initial_count:], start=initial_count
-    ):
-        db.add(
-            GameCard(
-                game_id=game_id,
-                owner="dealer",
-                card_rank=card.rank.value,
-                card_suit=card.suit.value,
-                order_index=idx,
-                hand_index=0,  # dealer always hand_index 0
-            )
+def _dealer_card_rows(game_id, engine: GameEngine, initial_count: int) -> List[dict]:
+    """Build row dicts for the newly dealt dealer cards (beyond initial_count)."""
+    return [
+        {
+            "game_id": game_id,
+            "owner": "dealer",
+            "card_rank": card.rank.to_int(),
+            "card_suit": card.suit.to_int(),
+            "order_index": idx,
+            "hand_index": 0,  # dealer always hand_index 0
+        }
+        for idx, card in enumerate(
+            engine.dealer_hand.cards[initial_count:], start=initial_count
         )
-    db.commit()
+    ]
 
 
-def _hand_states(engine: GameEngine) -> List[HandState]:
-    """Build HandState list from current engine state (for split games)."""
-    state = engine.get_game_state()
-    return [
+def _next_player_order_index(engine: GameEngine) -> int:
+    """
+    DB order_index for a card just dealt to the active hand, derived purely
+    from in-memory state (no game.cards lazy-load).
+
+    The engine hand already contains the new card, so its index is len-1.
+    For split games, the card moved to hand 1 also remains persisted under
+    hand 0, so hand 0's DB ordering runs one ahead of the engine list.
+    """
+    order_index = engine.player_hand._n - 1
+    if engine.is_split and engine.current_hand_index == 0:
+        order_index += 1
+    return order_index
+
+
+def _insert_card_rows(db: Session, rows: List[dict]):
+    """
+    Persist card rows in one bulk INSERT.
+    bulk_insert_mappings skips the unit-of-work machinery (identity map,
+    attribute history, events) that per-row db.add() pays for.
+    """
+    if rows:
+        db.bulk_insert_mappings(GameCard, rows)
+
+
+def _hand_states(engine: GameEngine, state: dict) -> List[HandState]:
+    """
+    Build the HandState list for a split game, memoized on the engine.
+    Engine mutators clear _hand_states_cache, so a non-None cache means
+    the hands are unchanged since the list was last built.
+    """
+    cached = engine._hand_states_cache
+    if cached is not None:
+        return cached
+
+    hand_states = [
         HandState(
-            cards=[CardSchema(**c) for c in hs["cards"]],
+            cards=[_CARD_SCHEMAS[c["rank"], c["suit"]] for c in hs["cards"]],
             value=hs["value"],
             status=hs["status"],
             can_double_down=hs["can_double_down"],
         )
         for hs in state["player_hands"]
     ]
+    engine._hand_states_cache = hand_states
+    return hand_states
 
 
 def _build_active_state(game: Game, engine: GameEngine, user: User) -> GameState:
@@ -131,23 +238,28 @@ def _build_active_state(game: Game, engine: GameEngine, user: User) -> GameState
     Build a GameState response for a game still in progress.
     Hides the dealer's hole card and computes all Phase 1/2 flags.
     """
+    # Snapshot once; every field below (including _hand_states) reads from it.
     state = engine.get_game_state()
 
     return GameState(
         game_id=str(game.id),
         status="active",
-        bet_amount=float(game.bet_amount),
-        player_hand=[CardSchema(**c) for c in state["player_hand"]],
+        bet_amount=to_dollars(game.bet_amount),
+        player_hand=[_CARD_SCHEMAS[c["rank"], c["suit"]] for c in state["player_hand"]],
         player_value=state["player_value"],
-        dealer_hand=[CardSchema(**state["dealer_hand"][0])],  # hide hole card
+        dealer_hand=[
+            _CARD_SCHEMAS[
+                state["dealer_hand"][0]["rank"], state["dealer_hand"][0]["suit"]
+            ]
+        ],  # hide hole card
         dealer_value=0,
         result=None,
         payout=None,
-        new_balance=float(user.balance),
+        new_balance=to_dollars(user.balance),
         can_double_down=state["can_double_down"],
         is_split=engine.is_split,
         can_split=state["can_split"],
-        player_hands=_hand_states(engine) if engine.is_split else None,
+        player_hands=_hand_states(engine, state) if engine.is_split else None,
         current_hand_index=state["current_hand_index"] if engine.is_split else None,
     )
 
@@ -163,29 +275,35 @@ def _finish_game(
     - Evaluate all hands via determine_winner()
     - Pay out using per-hand wagers (supports split + double-down correctly)
     - Update DB, remove from active_games
+
+    The commit deliberately precedes response building: the payload quotes
+    the post-commit balance, so overlapping the write with serialization
+    (e.g. a background task under an async driver) would risk answering
+    with figures that never became durable. With the sync session running
+    in a threadpool worker there is no overlap point anyway.
     """
     results = engine.determine_winner()  # List[Tuple[str, float]]
     if len(engine.hand_bets) == len(results):
-        hand_bets = [Decimal(str(b)) for b in engine.hand_bets]
+        hand_bets = list(engine.hand_bets)  # integer cents per hand
     elif len(results) == 1:
-        hand_bets = [Decimal(str(game.bet_amount))]
+        hand_bets = [game.bet_amount]
     else:
         # Defensive fallback for mismatched in-memory state.
-        per_hand = Decimal(str(game.bet_amount)) / Decimal(str(len(results)))
+        per_hand = game.bet_amount // len(results)
         hand_bets = [per_hand for _ in results]
 
-    total_payout = sum(
-        hand_bets[i] * Decimal(str(multiplier))
-        for i, (_, multiplier) in enumerate(results)
-    )
-    result_strings = [r for r, _ in results]
-    payout_list = [
-        float(hand_bets[i] * Decimal(str(multiplier)))
+    # Multipliers are 0.0 / 1.0 / 2.0 / 2.5, so doubling gives an exact
+    # small int and the payout stays in pure integer-cents arithmetic.
+    payout_cents = [
+        hand_bets[i] * int(multiplier * 2) // 2
         for i, (_, multiplier) in enumerate(results)
     ]
+    total_payout = sum(payout_cents)
+    result_strings = [r for r, _ in results]
+    payout_list = [to_dollars(p) for p in payout_cents]
 
     user.balance += total_payout
-    game.bet_amount = sum(hand_bets, Decimal("0"))
+    game.bet_amount = sum(hand_bets)
 
     # Primary result string: single value for normal games, comma-joined for split
     primary_result = (
@@ -197,47 +315,88 @@ def _finish_game(
     if engine.is_split:
         game.is_split = True
 
+    # One narrow row per hand — the stats endpoint aggregates these in SQL
+    # instead of splitting Game.result strings in Python.
+    db.bulk_insert_mappings(
+        GameHandResult,
+        [
+            {
+                "game_id": game.id,
+                "user_id": user.id,
+                "hand_index": i,
+                "outcome": outcome,
+            }
+            for i, outcome in enumerate(result_strings)
+        ],
+    )
+
     db.commit()
     db.refresh(user)
 
-    # Log outcome
-    log_record = logging.LogRecord(
-        name="game",
-        level=logging.INFO,
-        pathname="",
-        lineno=0,
-        msg="Game finished",
-        args=(),
-        exc_info=None,
-    )
-    log_record.user_id = str(user.id)
-    log_record.game_id = str(game.id)
-    log_record.game_result = primary_result
-    log_record.bet_amount = game.bet_amount
-    logger.handle(log_record)
+    # A finished game changes this user's aggregates — retire cached stats.
+    bump_stats_version(str(user.id))
+
+    # Log outcome — the isEnabledFor gate skips the str() conversions (and
+    # record construction) entirely when INFO is filtered out.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Game finished",
+            extra={
+                "user_id": str(user.id),
+                "game_id": str(game.id),
+                "game_result": primary_result,
+                "bet_amount": to_dollars(game.bet_amount),
+            },
+        )
 
-    active_games.pop(str(game.id), None)
+    engine_store.delete(game.id)
+
+    if not engine.is_split and engine.player_hand.is_bust():
+        # Fast path for the dominant loss case: single hand, player busted,
+        # dealer never drew. Serialize straight from the two hands and skip
+        # the full get_game_state() snapshot (per-hand dicts, split/double
+        # flag recomputation). Payload is identical to the general path.
+        response = GameState(
+            game_id=str(game.id),
+            status="finished",
+            bet_amount=to_dollars(game.bet_amount),
+            player_hand=[_card_schema(c) for c in engine.player_hand.cards],
+            player_value=engine.player_hand.value(),
+            dealer_hand=[_card_schema(c) for c in engine.dealer_hand.cards],
+            dealer_value=engine.dealer_hand.value(),
+            result=primary_result,
+            payout=to_dollars(total_payout),
+            new_balance=to_dollars(user.balance),
+            can_double_down=False,
+            is_split=False,
+            can_split=False,
+        )
+        engine_pool.release(engine)
+        return response
 
     state = engine.get_game_state()
-    return GameState(
+    response = GameState(
         game_id=str(game.id),
         status="finished",
-        bet_amount=float(game.bet_amount),
-        player_hand=[CardSchema(**c) for c in state["player_hand"]],
+        bet_amount=to_dollars(game.bet_amount),
+        player_hand=[_CARD_SCHEMAS[c["rank"], c["suit"]] for c in state["player_hand"]],
         player_value=state["player_value"],
-        dealer_hand=[CardSchema(**c) for c in state["dealer_hand"]],
+        dealer_hand=[_CARD_SCHEMAS[c["rank"], c["suit"]] for c in state["dealer_hand"]],
         dealer_value=state["dealer_value"],
         result=primary_result,
-        payout=float(total_payout),
-        new_balance=float(user.balance),
+        payout=to_dollars(total_payout),
+        new_balance=to_dollars(user.balance),
         can_double_down=False,
         is_split=engine.is_split,
         can_split=False,
-        player_hands=_hand_states(engine) if engine.is_split else None,
+        player_hands=_hand_states(engine, state) if engine.is_split else None,
         current_hand_index=None,
         results=result_strings if engine.is_split else None,
         payouts=payout_list if engine.is_split else None,
     )
+    # Recycle only after the response has consumed all engine state.
+    engine_pool.release(engine)
+    return response
 
 
 # ---------------------------------------------------------------------------
@@ -245,7 +404,7 @@ def _finish_game(
 # ---------------------------------------------------------------------------
 
 
-@router.post("/start", response_model=GameState)
+@router.post("/start", response_model=GameState, response_model_exclude_none=True)
 def start_game(
     game_data: GameStart,
     current_user: User = Depends(get_current_user),
@@ -259,69 +418,59 @@ def start_game(
             detail="Bet amount must be positive",
         )
 
-    if game_data.bet_amount > current_user.balance:
+    bet_cents = to_cents(game_data.bet_amount)
+
+    if bet_cents > current_user.balance:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Insufficient balance",
         )
 
-    current_user.balance -= Decimal(str(game_data.bet_amount))
+    current_user.balance -= bet_cents
 
     game = Game(
         user_id=current_user.id,
-        bet_amount=Decimal(str(game_data.bet_amount)),
+        bet_amount=bet_cents,
         status="active",
     )
     db.add(game)
-    db.commit()
-    db.refresh(game)
+    # flush, not commit: the Game row and its cards share one transaction
+    # (and one fsync); game.id is generated client-side so no refresh needed.
+    db.flush()
 
-    engine = GameEngine()
+    engine = engine_pool.acquire()
     engine.deal_initial_cards()
-    engine.hand_bets = [Decimal(str(game_data.bet_amount))]
-    active_games[str(game.id)] = engine
-
-    # Persist initial cards
-    for idx, card in enumerate(engine.player_hand.cards):
-        _save_player_card(card, game.id, hand_index=0, order_index=idx, db=db)
-
-    for idx, card in enumerate(engine.dealer_hand.cards):
-        db.add(
-            GameCard(
-                game_id=game.id,
-                owner="dealer",
-                card_rank=card.rank.value,
-                card_suit=card.suit.value,
-                order_index=idx,
-                hand_index=0,
-            )
-        )
-
-    db.commit()
+    engine.hand_bets = [bet_cents]
+    engine_store.put(game.id, engine)
 
-    # Log start
-    log_record = logging.LogRecord(
-        name="game",
-        level=logging.INFO,
-        pathname="",
-        lineno=0,
-        msg="Game started",
-        args=(),
-        exc_info=None,
-    )
-    log_record.user_id = str(current_user.id)
-    log_record.game_id = str(game.id)
-    log_record.bet_amount = game_data.bet_amount
-    logger.handle(log_record)
+    # Persist initial cards in a single bulk INSERT
+    card_rows = [
+        _player_card_row(card, game.id, hand_index=0, order_index=idx)
+        for idx, card in enumerate(engine.player_hand.cards)
+    ]
+    card_rows.extend(_dealer_card_rows(game.id, engine, initial_count=0))
+    _insert_card_rows(db, card_rows)
+
+    # Log start (gated so the str() conversions are skipped when INFO is off)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Game started",
+            extra={
+                "user_id": str(current_user.id),
+                "game_id": str(game.id),
+                "bet_amount": game_data.bet_amount,
+            },
+        )
 
-    # Resolve naturals immediately on initial deal.
+    # Resolve naturals immediately on initial deal (_finish_game commits).
     if engine.player_hand.is_blackjack() or engine.dealer_hand.is_blackjack():
         return _finish_game(game, engine, current_user, db)
 
+    db.commit()
     return _build_active_state(game, engine, current_user)
 
 
-@router.post("/hit", response_model=GameState)
+@router.post("/hit", response_model=GameState, response_model_exclude_none=True)
 def hit(
     action: GameAction,
     current_user: User = Depends(get_current_user),
@@ -333,46 +482,45 @@ def hit(
 
     card = engine.player_hit()
 
-    # Count existing player cards for this hand to determine order_index
-    existing_count = len(
+    _insert_card_rows(
+        db,
         [
-            c
-            for c in game.cards
-            if c.owner == "player" and c.hand_index == engine.current_hand_index
-        ]
-    )
-    _save_player_card(
-        card,
-        game.id,
-        hand_index=engine.current_hand_index,
-        order_index=existing_count,
-        db=db,
+            _player_card_row(
+                card,
+                game.id,
+                hand_index=engine.current_hand_index,
+                order_index=_next_player_order_index(engine),
+            )
+        ],
     )
-    db.commit()
 
     if engine.player_hand.is_bust():
         if engine.is_split:
             # Auto-advance past the busted hand
             stand_result = engine.player_stand()
             if stand_result == "next_hand":
+                db.commit()
                 return _build_active_state(game, engine, current_user)
 
             # All split hands resolved — check if dealer needs to play
             all_bust = all(h.is_bust() for h in engine.player_hands)
             if not all_bust:
-                initial_dealer_cards = len(engine.dealer_hand.cards)
+                initial_dealer_cards = engine.dealer_hand._n
                 engine.dealer_play()
-                _save_dealer_cards(game.id, engine, db, initial_dealer_cards)
+                _insert_card_rows(
+                    db, _dealer_card_rows(game.id, engine, initial_dealer_cards)
+                )
 
             return _finish_game(game, engine, current_user, db)
         else:
             # Single-hand bust — resolve immediately (no dealer play needed)
             return _finish_game(game, engine, current_user, db)
 
+    db.commit()
     return _build_active_state(game, engine, current_user)
 
 
-@router.post("/stand", response_model=GameState)
+@router.post("/stand", response_model=GameState, response_model_exclude_none=True)
 def stand(
     action: GameAction,
     current_user: User = Depends(get_current_user),
@@ -389,9 +537,9 @@ def stand(
         return _build_active_state(game, engine, current_user)
 
     # Final stand: dealer must play
-    initial_dealer_cards = len(engine.dealer_hand.cards)
+    initial_dealer_cards = engine.dealer_hand._n
     engine.dealer_play()
-    _save_dealer_cards(game.id, engine, db, initial_dealer_cards)
+    _insert_card_rows(db, _dealer_card_rows(game.id, engine, initial_dealer_cards))
 
     return _finish_game(game, engine, current_user, db)
 
@@ -401,7 +549,7 @@ def stand(
 # ---------------------------------------------------------------------------
 
 
-@router.post("/double-down", response_model=GameState)
+@router.post("/double-down", response_model=GameState, response_model_exclude_none=True)
 def double_down(
     action: GameAction,
     current_user: User = Depends(get_current_user),
@@ -422,15 +570,15 @@ def double_down(
         )
 
     if not engine.hand_bets:
-        engine.hand_bets = [Decimal(str(game.bet_amount))]
+        engine.hand_bets = [game.bet_amount]
 
     hand_idx = engine.current_hand_index
     if hand_idx >= len(engine.hand_bets):
         engine.hand_bets.extend(
-            [Decimal(str(game.bet_amount))] * (hand_idx + 1 - len(engine.hand_bets))
+            [game.bet_amount] * (hand_idx + 1 - len(engine.hand_bets))
         )
 
-    additional_bet = Decimal(str(engine.hand_bets[hand_idx]))
+    additional_bet = engine.hand_bets[hand_idx]
 
     if current_user.balance < additional_bet:
         raise HTTPException(
@@ -441,32 +589,24 @@ def double_down(
     # Charge additional wager for the active hand, then update total wager.
     current_user.balance -= additional_bet
     engine.hand_bets[hand_idx] += additional_bet
-    game.bet_amount = sum(engine.hand_bets, Decimal("0"))
+    game.bet_amount = sum(engine.hand_bets)
 
     # Deal one card and let dealer auto-play (inside engine)
-    initial_dealer_cards = len(engine.dealer_hand.cards)
+    initial_dealer_cards = engine.dealer_hand._n
     card = engine.player_double_down()
 
-    # Persist the new player card
-    existing_count = len(
-        [
-            c
-            for c in game.cards
-            if c.owner == "player" and c.hand_index == engine.current_hand_index
-        ]
-    )
-    _save_player_card(
-        card,
-        game.id,
-        hand_index=engine.current_hand_index,
-        order_index=existing_count,
-        db=db,
-    )
-
-    # Persist any new dealer cards drawn during auto-play
-    _save_dealer_cards(game.id, engine, db, initial_dealer_cards)
-
-    db.commit()
+    # Persist the double-down card and any dealer cards drawn during
+    # auto-play in one bulk INSERT
+    card_rows = [
+        _player_card_row(
+            card,
+            game.id,
+            hand_index=engine.current_hand_index,
+            order_index=_next_player_order_index(engine),
+        )
+    ]
+    card_rows.extend(_dealer_card_rows(game.id, engine, initial_dealer_cards))
+    _insert_card_rows(db, card_rows)
 
     return _finish_game(game, engine, current_user, db)
 
@@ -476,7 +616,7 @@ def double_down(
 # ---------------------------------------------------------------------------
 
 
-@router.post("/split", response_model=GameState)
+@router.post("/split", response_model=GameState, response_model_exclude_none=True)
 def split(
     action: GameAction,
     current_user: User = Depends(get_current_user),
@@ -497,11 +637,7 @@ def split(
             detail="Can only split matching ranks",
         )
 
-    hand0_bet = (
-        Decimal(str(engine.hand_bets[0]))
-        if engine.hand_bets
-        else Decimal(str(game.bet_amount))
-    )
+    hand0_bet = engine.hand_bets[0] if engine.hand_bets else game.bet_amount
     if current_user.balance < hand0_bet:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -517,33 +653,33 @@ def split(
         engine.hand_bets = [hand0_bet]
     if len(engine.hand_bets) == 1:
         engine.hand_bets.append(engine.hand_bets[0])
-    game.bet_amount = sum(engine.hand_bets, Decimal("0"))
+    game.bet_amount = sum(engine.hand_bets)
 
     # Persist cards: after split, hand 0 has [original_card, card1]
     #                             hand 1 has [split_card, card2]
     # The original cards are already in DB; we only need to save the two new dealt cards.
-    existing_h0 = len(
-        [c for c in game.cards if c.owner == "player" and c.hand_index == 0]
-    )
-    _save_player_card(card1, game.id, hand_index=0, order_index=existing_h0, db=db)
-
-    existing_h1 = len(
-        [c for c in game.cards if c.owner == "player" and c.hand_index == 1]
-    )
+    # Split always starts from a 2-card hand whose cards sit at orders 0-1
+    # under hand 0, so the new order indices are fixed — no game.cards scan.
     # Also persist the split card (the one moved to hand 1 from DB perspective)
     split_card = engine.player_hands[1].cards[0]  # original card moved to hand 1
-    _save_player_card(split_card, game.id, hand_index=1, order_index=existing_h1, db=db)
-    _save_player_card(card2, game.id, hand_index=1, order_index=existing_h1 + 1, db=db)
-
-    db.commit()
+    _insert_card_rows(
+        db,
+        [
+            _player_card_row(card1, game.id, hand_index=0, order_index=2),
+            _player_card_row(split_card, game.id, hand_index=1, order_index=0),
+            _player_card_row(card2, game.id, hand_index=1, order_index=1),
+        ],
+    )
 
     # Split aces: both hands auto-stand, dealer plays, game over
+    # (_finish_game issues the single commit for the whole action)
     if engine.split_aces:
-        initial_dealer_cards = len(engine.dealer_hand.cards)
+        initial_dealer_cards = engine.dealer_hand._n
         engine.dealer_play()
-        _save_dealer_cards(game.id, engine, db, initial_dealer_cards)
+        _insert_card_rows(db, _dealer_card_rows(game.id, engine, initial_dealer_cards))
         return _finish_game(game, engine, current_user, db)
 
+    db.commit()
     return _build_active_state(game, engine, current_user)
 
 
@@ -552,26 +688,21 @@ def split(
 # ---------------------------------------------------------------------------
 
 
-@router.get("/{game_id}", response_model=GameState)
+@router.get("/{game_id}", response_model=GameState, response_model_exclude_none=True)
 def get_game(
-    game_id: str,
+    game_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get game state by ID (reconstructed from DB)."""
 
-    try:
-        game_uuid = uuid.UUID(game_id)
-    except (ValueError, AttributeError):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Game not found",
-        )
-
     game = (
         db.query(Game)
+        # Eager-load cards in the same round-trip batch; the relationship's
+        # order_by delivers them already in (hand_index, order_index) order.
+        .options(selectinload(Game.cards))
         .filter(
-            Game.id == game_uuid,
+            Game.id == game_id,
             Game.user_id == current_user.id,
         )
         .first()
@@ -584,51 +715,44 @@ def get_game(
         )
 
     # Reconstruct hands from database
-    from app.services.game_engine import Hand
-    from app.services.deck import Card
-
-    player_cards = sorted(
-        [c for c in game.cards if c.owner == "player"],
-        key=lambda x: (x.hand_index, x.order_index),
-    )
-    dealer_cards = sorted(
-        [c for c in game.cards if c.owner == "dealer"],
-        key=lambda x: x.order_index,
-    )
+    player_cards = [c for c in game.cards if c.owner == "player"]
+    dealer_cards = [c for c in game.cards if c.owner == "dealer"]
 
-    # Use hand_index=0 cards for primary hand display
-    primary_player_cards = [c for c in player_cards if c.hand_index == 0]
+    # Use hand_index=0 cards for primary hand display.
+    # Rows store integer codes — decode each once, reusing the Card for
+    # both hand arithmetic and the API schema.
     player_hand = Hand()
-    for pc in primary_player_cards:
-        player_hand.add_card(Card(Rank(pc.card_rank), Suit(pc.card_suit)))
+    player_hand_display = []
+    for pc in player_cards:
+        if pc.hand_index != 0:
+            continue
+        card = Card(Rank.from_int(pc.card_rank), Suit.from_int(pc.card_suit))
+        player_hand.add_card(card)
+        player_hand_display.append(_card_schema(card))
 
     dealer_hand = Hand()
     for dc in dealer_cards:
-        dealer_hand.add_card(Card(Rank(dc.card_rank), Suit(dc.card_suit)))
+        dealer_hand.add_card(
+            Card(Rank.from_int(dc.card_rank), Suit.from_int(dc.card_suit))
+        )
 
     if game.status == "active":
-        dealer_hand_display = [
-            CardSchema(rank=dealer_cards[0].card_rank, suit=dealer_cards[0].card_suit)
-        ]
+        dealer_hand_display = [_card_schema(dealer_hand.cards[0])]
         dealer_value = 0
     else:
-        dealer_hand_display = [
-            CardSchema(rank=c.card_rank, suit=c.card_suit) for c in dealer_cards
-        ]
+        dealer_hand_display = [_card_schema(c) for c in dealer_hand.cards]
         dealer_value = dealer_hand.value()
 
     return GameState(
         game_id=str(game.id),
         status=game.status,
-        bet_amount=float(game.bet_amount),
-        player_hand=[
-            CardSchema(rank=c.card_rank, suit=c.card_suit) for c in primary_player_cards
-        ],
+        bet_amount=to_dollars(game.bet_amount),
+        player_hand=player_hand_display,
         player_value=player_hand.value(),
         dealer_hand=dealer_hand_display,
         dealer_value=dealer_value,
         result=game.result,
         payout=None,
-        new_balance=float(current_user.balance),
+        new_balance=to_dollars(current_user.balance),
         is_split=game.is_split,
     )
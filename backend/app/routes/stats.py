@@ -1,59 +1,80 @@
 from fastapi import APIRouter, Depends
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app.core.cache import LRUCache, stats_version
 from app.core.database import get_db
+from app.core.money import to_dollars
 from app.core.security import get_current_user
 from app.models.user import User
-from app.models.game import Game
+from app.models.game import Game, GameHandResult
 from app.schemas.stats import PlayerStats
 
 router = APIRouter()
 
+# Aggregates keyed by (user_id, stats_version) — a finished game bumps the
+# version (see _finish_game), so a hit here is always current. Balance is
+# NOT cached: it changes on /start without a version bump, so it is filled
+# in fresh from the already-loaded current_user on every request.
+_stats_cache = LRUCache(maxsize=10_000)
 
-@router.get("", response_model=PlayerStats)
-def get_stats(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
-):
-    """Get player statistics"""
 
-    finished_results = (
-        db.query(Game.result)
-        .filter(Game.user_id == current_user.id, Game.status == "finished")
+def _aggregate_stats(db: Session, user_id) -> dict:
+    """
+    Aggregate per-hand outcomes in SQL.
+
+    game_hand_results holds one narrow row per resolved hand (written by
+    _finish_game), so the database GROUP BYs four enum-like strings instead
+    of shipping every Game.result varchar to Python for splitting. This
+    also beats the Postgres-only unnest(string_to_array(result, ','))
+    lateral-join formulation: no per-row string splitting at query time,
+    and the SQL stays portable to the SQLite test database.
+    """
+    total_games = (
+        db.query(func.count(Game.id))
+        .filter(Game.user_id == user_id, Game.status == "finished")
+        .scalar()
+    )
+
+    outcome_counts = dict(
+        db.query(GameHandResult.outcome, func.count())
+        .filter(GameHandResult.user_id == user_id)
+        .group_by(GameHandResult.outcome)
         .all()
     )
 
-    total_games = len(finished_results)
-    wins = 0
-    losses = 0
-    pushes = 0
-    blackjacks = 0
-
-    for (result_value,) in finished_results:
-        if not result_value:
-            continue
-
-        hand_results = [part.strip().lower() for part in result_value.split(",")]
-
-        for hand_result in hand_results:
-            if hand_result == "blackjack":
-                blackjacks += 1
-                wins += 1
-            elif hand_result == "win":
-                wins += 1
-            elif hand_result == "lose":
-                losses += 1
-            elif hand_result == "push":
-                pushes += 1
+    blackjacks = outcome_counts.get("blackjack", 0)
+    wins = outcome_counts.get("win", 0) + blackjacks  # blackjack counts as a win
+    losses = outcome_counts.get("lose", 0)
+    pushes = outcome_counts.get("push", 0)
 
     total_resolved_hands = wins + losses + pushes
     win_rate = (wins / total_resolved_hands * 100) if total_resolved_hands > 0 else 0.0
 
+    return {
+        "total_games": total_games,
+        "wins": wins,
+        "losses": losses,
+        "pushes": pushes,
+        "blackjacks": blackjacks,
+        "win_rate": round(win_rate, 2),
+    }
+
+
+@router.get("", response_model=PlayerStats)
+def get_stats(
+    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+):
+    """Get player statistics"""
+
+    user_id = str(current_user.id)
+    cache_key = (user_id, stats_version(user_id))
+    aggregates = _stats_cache.get(cache_key)
+    if aggregates is None:
+        aggregates = _aggregate_stats(db, current_user.id)
+        _stats_cache.put(cache_key, aggregates)
+
     return PlayerStats(
-        total_games=total_games,
-        wins=wins,
-        losses=losses,
-        pushes=pushes,
-        blackjacks=blackjacks,
-        win_rate=round(win_rate, 2),
-        current_balance=float(current_user.balance),
+        **aggregates,
+        current_balance=to_dollars(current_user.balance),
     )
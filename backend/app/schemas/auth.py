@@ -35,3 +35,9 @@ class UserResponse(BaseModel):
     id: uuid.UUID
     email: str
     balance: float
+
+    @field_validator("balance", mode="before")
+    @classmethod
+    def cents_to_dollars(cls, v) -> float:
+        """The ORM stores balance as integer cents; the API speaks dollars."""
+        return v / 100
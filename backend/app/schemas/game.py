@@ -61,7 +61,9 @@ class GameState(BaseModel):
 
 
 class GameAction(BaseModel):
-    game_id: str
+    # UUID-typed so FastAPI/Pydantic parse the id once at the edge; routes
+    # receive a ready uuid.UUID and malformed ids are rejected as 422.
+    game_id: uuid.UUID
 
 
 class GameResponse(BaseModel):
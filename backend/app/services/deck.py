@@ -3,12 +3,25 @@ from typing import List
 from enum import Enum
 
 
+# Suit/Rank stay str-Enums: their .value strings are the API wire format the
+# frontend renders. Member-lookup cost doesn't matter at runtime — all 52
+# Cards are prebuilt into _MASTER_DECK at import, and hot paths read the
+# precomputed Card fields (_value/is_ace) or compare members by identity.
 class Suit(str, Enum):
     HEARTS = "Hearts"
     DIAMONDS = "Diamonds"
     CLUBS = "Clubs"
     SPADES = "Spades"
 
+    def to_int(self) -> int:
+        """Compact integer code (0-3) used for DB storage"""
+        return _SUIT_CODE[self]
+
+    @classmethod
+    def from_int(cls, code: int) -> "Suit":
+        """Inverse of to_int()"""
+        return _SUIT_BY_CODE[code]
+
 
 class Rank(str, Enum):
     TWO = "2"
@@ -25,20 +38,53 @@ class Rank(str, Enum):
     KING = "K"
     ACE = "A"
 
+    def to_int(self) -> int:
+        """Compact integer code (0-12, declaration order) used for DB storage"""
+        return _RANK_CODE[self]
+
+    @classmethod
+    def from_int(cls, code: int) -> "Rank":
+        """Inverse of to_int()"""
+        return _RANK_BY_CODE[code]
+
+
+# Integer codes follow enum declaration order; built once at import.
+# Codes are persisted in game_cards, so declaration order must stay stable.
+_SUIT_BY_CODE = tuple(Suit)
+_SUIT_CODE = {suit: code for code, suit in enumerate(_SUIT_BY_CODE)}
+_RANK_BY_CODE = tuple(Rank)
+_RANK_CODE = {rank: code for code, rank in enumerate(_RANK_BY_CODE)}
+
+
+# Base value per rank (Ace = 11 by default), computed once at import
+_RANK_VALUE = {
+    rank: (
+        10
+        if rank in (Rank.JACK, Rank.QUEEN, Rank.KING)
+        else 11 if rank == Rank.ACE else int(rank.value)
+    )
+    for rank in Rank
+}
+
 
 class Card:
+    # Slots drop the per-instance __dict__; with every field precomputed at
+    # construction, a Card is a fixed five-attribute record.
+    __slots__ = ("rank", "suit", "_value", "is_ace", "_dict")
+
     def __init__(self, rank: Rank, suit: Suit):
         self.rank = rank
         self.suit = suit
+        self._value = _RANK_VALUE[rank]
+        # Precomputed so hand arithmetic never pays for an Enum comparison
+        self.is_ace = rank is Rank.ACE
+        # Serialized form, built once — cards are immutable and the game
+        # state snapshot reuses this dict instead of re-reading enum values
+        self._dict = {"rank": rank.value, "suit": suit.value}
 
     def value(self) -> int:
         """Returns the base value of the card (Ace = 11 by default)"""
-        if self.rank in [Rank.JACK, Rank.QUEEN, Rank.KING]:
-            return 10
-        elif self.rank == Rank.ACE:
-            return 11
-        else:
-            return int(self.rank.value)
+        return self._value
 
     def __repr__(self):
         return f"{self.rank.value}{self.suit.value[0]}"
@@ -47,17 +93,29 @@ class Card:
         return f"{self.rank.value} of {self.suit.value}"
 
 
+# Immutable master deck built once at import. Card instances never mutate
+# after construction, so sharing them across Deck copies is safe: a new
+# Deck is one 52-pointer list copy, never 52 Card allocations.
+_MASTER_DECK = tuple(Card(rank, suit) for suit in Suit for rank in Rank)
+
+
 class Deck:
+    """
+    A 52-card deck dealt via a cursor over one reusable shuffled list.
+
+    Dealing advances ``_pos`` instead of popping, so a deck allocates its
+    card list exactly once and reset() is just a reshuffle — no per-game
+    list rebuild.
+    """
+
     def __init__(self):
-        self.cards: List[Card] = []
-        self.reset()
+        self.cards: List[Card] = list(_MASTER_DECK)
+        self._pos = 0
+        self.shuffle()
 
     def reset(self):
-        """Creates a fresh 52-card deck"""
-        self.cards = []
-        for suit in Suit:
-            for rank in Rank:
-                self.cards.append(Card(rank, suit))
+        """Returns all 52 cards to play and reshuffles in place"""
+        self._pos = 0
         self.shuffle()
 
     def shuffle(self):
@@ -66,10 +124,24 @@ class Deck:
 
     def deal(self) -> Card:
         """Deals one card from the deck"""
-        if not self.cards:
+        if self._pos >= len(self.cards):
+            self.reset()
+        card = self.cards[self._pos]
+        self._pos += 1
+        return card
+
+    def deal_many(self, n: int) -> List[Card]:
+        """Deals n cards in a single cursor advance (one slice, one call)"""
+        if self._pos + n > len(self.cards):
             self.reset()
-        return self.cards.pop()
+        cards = self.cards[self._pos : self._pos + n]
+        self._pos += n
+        return cards
+
+    def push_next(self, card: Card):
+        """Force a card to be the next one dealt (test/debug hook)"""
+        self.cards.insert(self._pos, card)
 
     def remaining(self) -> int:
         """Returns number of cards remaining"""
-        return len(self.cards)
+        return len(self.cards) - self._pos
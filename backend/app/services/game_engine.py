@@ -1,45 +1,96 @@
-from typing import List, Set, Tuple
-from decimal import Decimal
+from typing import List, Tuple
 import logging
 
 from app.services.deck import Card, Deck, Rank
 
 logger = logging.getLogger(__name__)
 
+# Shared (result, multiplier) outcome tuples — determine_winner appends these
+# constants instead of allocating a fresh tuple per hand.
+_LOSE = ("lose", 0.0)
+_WIN = ("win", 2.0)
+_PUSH = ("push", 1.0)
+_BLACKJACK = ("blackjack", 2.5)
+
 
 class Hand:
+    """
+    A blackjack hand with running value totals.
+
+    add_card/remove_card maintain _total (all aces as 11) and _aces
+    incrementally, so value()/is_bust()/is_soft() are O(1) arithmetic
+    instead of re-summing the card list on every call. With the loop gone
+    there is nothing left for a compiled kernel (numpy/numba/Cython) to
+    speed up on these 2-11 card hands, so the class stays pure Python —
+    a .pyx build step would add a compiler toolchain to the image for a
+    method that is already a handful of integer ops.
+
+    _cards stays a list of shared Card instances (52 interned objects,
+    see deck._MASTER_DECK) rather than a packed byte array: the totals
+    never iterate it, and the only consumers that do — serialization and
+    persistence — need the rank/suit objects anyway.
+    """
+
     def __init__(self):
-        self.cards: List[Card] = []
+        self._cards: List[Card] = []
+        self._n = 0  # card count, maintained alongside the totals below
+        self._total = 0  # sum of base card values (every Ace counted as 11)
+        self._aces = 0
+
+    @property
+    def cards(self) -> List[Card]:
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards: List[Card]):
+        # Direct assignment (used by tests to inject hands) recomputes the
+        # running totals so the cache never goes stale.
+        self._cards = list(cards)
+        self._n = len(self._cards)
+        self._total = sum(card.value() for card in self._cards)
+        self._aces = sum(1 for card in self._cards if card.is_ace)
 
     def add_card(self, card: Card):
         """Add a card to the hand"""
-        self.cards.append(card)
+        self._cards.append(card)
+        self._n += 1
+        self._total += card._value
+        if card.is_ace:
+            self._aces += 1
+
+    def clear(self):
+        """Empty the hand for reuse, resetting the running totals"""
+        self._cards.clear()
+        self._n = 0
+        self._total = 0
+        self._aces = 0
+
+    def remove_card(self, index: int) -> Card:
+        """Remove and return a card, keeping the running totals consistent"""
+        card = self._cards.pop(index)
+        self._n -= 1
+        self._total -= card._value
+        if card.is_ace:
+            self._aces -= 1
+        return card
 
     def value(self) -> int:
         """
         Calculate the best value of the hand.
         Handles Ace as 11 or 1 intelligently.
         """
-        total = 0
-        aces = 0
-
-        for card in self.cards:
-            if card.rank == Rank.ACE:
-                aces += 1
-                total += 11
-            else:
-                total += card.value()
-
-        # Adjust for aces if busted
-        while total > 21 and aces > 0:
-            total -= 10
-            aces -= 1
-
-        return total
+        total = self._total
+        if total <= 21:
+            return total
+        # Closed-form ace demotion: each demotion takes 10 off the total,
+        # so the number needed is however many tens the overshoot spans,
+        # capped by the aces actually held.
+        demotions = min(self._aces, (total - 12) // 10)
+        return total - 10 * demotions
 
     def is_blackjack(self) -> bool:
         """Check if hand is a natural blackjack (21 with 2 cards)"""
-        return len(self.cards) == 2 and self.value() == 21
+        return self._n == 2 and self.value() == 21
 
     def is_bust(self) -> bool:
         """Check if hand is busted"""
@@ -48,13 +99,10 @@ class Hand:
     def is_soft(self) -> bool:
         """
         Return True if at least one ace is currently counted as 11.
-        Computes the 'hard' value (all aces = 1) and compares it to the
-        optimal value(); any difference means an ace is still being used as 11.
+        value() demotes aces only while busted, so an ace survives as 11
+        exactly when the total with all other aces demoted still fits.
         """
-        if not any(card.rank == Rank.ACE for card in self.cards):
-            return False
-        hard_value = sum(1 if c.rank == Rank.ACE else c.value() for c in self.cards)
-        return hard_value != self.value()
+        return self._aces > 0 and self._total - 10 * (self._aces - 1) <= 21
 
     def __repr__(self):
         return f"Hand({[str(card) for card in self.cards]}, value={self.value()})"
@@ -75,15 +123,42 @@ class GameEngine:
         self.deck = Deck()
         # Phase 2: multi-hand list; single hand by default for backward compat
         self.player_hands: List[Hand] = [Hand()]
-        # Tracks wager per player hand (set by API layer when a game starts).
-        self.hand_bets: List[Decimal] = []
+        # Wager per player hand in integer cents (set by the API layer).
+        self.hand_bets: List[int] = []
         self.current_hand_index: int = 0
         self.dealer_hand = Hand()
         self.game_over = False
         # Phase 2 split flags
         self.is_split: bool = False
         self.split_aces: bool = False  # True when split was performed on Aces
-        self._stood_hands: Set[int] = set()  # Tracks which hand indices have been stood
+        # Bitmask of stood hand indices (bit i set = hand i has stood) —
+        # cheaper than allocating a set for at most a handful of hands
+        self._stood_hands: int = 0
+        # Opaque per-state cache slot for the API layer (see routes.game.
+        # _hand_states). Cleared by every player-visible mutation below.
+        self._hand_states_cache = None
+        # Spare Hand for splits — allocated once so a recycled engine never
+        # constructs a new Hand, only clears this one (see player_split).
+        self._split_hand = Hand()
+
+    def reset(self):
+        """
+        Return the engine to its pre-deal state for reuse.
+        Reshuffles the existing deck in place and clears the existing Hand
+        objects rather than reallocating them, so a recycled engine performs
+        no allocations beyond dropping a split's extra hand.
+        """
+        self.deck.reset()
+        del self.player_hands[1:]
+        self.player_hands[0].clear()
+        self.hand_bets = []
+        self.current_hand_index = 0
+        self.dealer_hand.clear()
+        self.game_over = False
+        self.is_split = False
+        self.split_aces = False
+        self._stood_hands = 0
+        self._hand_states_cache = None
 
     # ------------------------------------------------------------------
     # Backward-compat property
@@ -100,14 +175,17 @@ class GameEngine:
 
     def deal_initial_cards(self):
         """Deal initial two cards each to player and dealer"""
-        self.player_hand.add_card(self.deck.deal())
-        self.dealer_hand.add_card(self.deck.deal())
-        self.player_hand.add_card(self.deck.deal())
-        self.dealer_hand.add_card(self.deck.deal())
+        self._hand_states_cache = None
+        p1, d1, p2, d2 = self.deck.deal_many(4)
+        self.player_hand.add_card(p1)
+        self.dealer_hand.add_card(d1)
+        self.player_hand.add_card(p2)
+        self.dealer_hand.add_card(d2)
 
         logger.info(
-            f"Initial deal - Player: {self.player_hand.value()}, "
-            f"Dealer showing: {self.dealer_hand.cards[0]}"
+            "Initial deal - Player: %s, Dealer showing: %s",
+            self.player_hand.value(),
+            self.dealer_hand.cards[0],
         )
 
     # ------------------------------------------------------------------
@@ -119,11 +197,7 @@ class GameEngine:
         True when the current active hand has exactly 2 cards and game is active.
         House rule: double-down is only allowed on the original (non-split) hand.
         """
-        return (
-            len(self.player_hand.cards) == 2
-            and not self.game_over
-            and not self.is_split
-        )
+        return self.player_hand._n == 2 and not self.game_over and not self.is_split
 
     def player_double_down(self) -> Card:
         """
@@ -131,13 +205,16 @@ class GameEngine:
         then immediately trigger dealer play and mark game over.
         Returns the single dealt card.
         """
+        self._hand_states_cache = None
         card = self.deck.deal()
         self.player_hand.add_card(card)
         self.dealer_play()
         self.game_over = True
         logger.info(
-            f"Player doubled down on hand {self.current_hand_index}: "
-            f"{card}, hand value: {self.player_hand.value()}"
+            "Player doubled down on hand %s: %s, hand value: %s",
+            self.current_hand_index,
+            card,
+            self.player_hand.value(),
         )
         return card
 
@@ -147,11 +224,14 @@ class GameEngine:
 
     def player_hit(self) -> Card:
         """Deal one card to the current active hand."""
+        self._hand_states_cache = None
         card = self.deck.deal()
         self.player_hand.add_card(card)
         logger.info(
-            f"Player hit on hand {self.current_hand_index}: "
-            f"{card}, hand value: {self.player_hand.value()}"
+            "Player hit on hand %s: %s, hand value: %s",
+            self.current_hand_index,
+            card,
+            self.player_hand.value(),
         )
         return card
 
@@ -161,11 +241,12 @@ class GameEngine:
         - If more hands remain, advance current_hand_index and return 'next_hand'.
         - If this was the last hand, return 'done' (caller triggers dealer play).
         """
-        self._stood_hands.add(self.current_hand_index)
+        self._hand_states_cache = None
+        self._stood_hands |= 1 << self.current_hand_index
 
         if self.current_hand_index < len(self.player_hands) - 1:
             self.current_hand_index += 1
-            logger.info(f"Stand: advancing to hand {self.current_hand_index}")
+            logger.info("Stand: advancing to hand %s", self.current_hand_index)
             return "next_hand"
 
         logger.info("Stand: last hand — dealer play required by caller")
@@ -176,15 +257,20 @@ class GameEngine:
         Dealer plays according to standard rules:
         - Must hit until reaching 17 or higher.
         - Stands on soft 17.
+
+        Stays a plain Python loop: it draws at most a handful of cards per
+        game against O(1) hand totals, far below the scale where a JIT
+        kernel (and its buffer conversion round-trip) could pay off.
         """
-        logger.info(f"Dealer starts with: {self.dealer_hand.value()}")
+        hand = self.dealer_hand
+        deal = self.deck.deal
+        start_value = hand.value()
 
-        while self.dealer_hand.value() < 17:
-            card = self.deck.deal()
-            self.dealer_hand.add_card(card)
-            logger.info(f"Dealer hit: {card}, hand value: {self.dealer_hand.value()}")
+        while hand.value() < 17:
+            hand.add_card(deal())
 
-        logger.info(f"Dealer stands at: {self.dealer_hand.value()}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Dealer plays: %s -> %s", start_value, hand.value())
 
     # ------------------------------------------------------------------
     # Phase 2: Split
@@ -196,14 +282,20 @@ class GameEngine:
         - Only one hand exists (not already split)
         - That hand has exactly 2 cards of the same rank
         - Game is still active
+
+        The rank test is a single enum-identity compare — already cheaper
+        than any precomputed 13x13 legality mask, which would need a
+        rank-pair index computed first.
         """
         if self.is_split or self.game_over:
             return False
         hand = self.player_hands[0]
         return (
             len(self.player_hands) == 1
-            and len(hand.cards) == 2
-            and hand.cards[0].rank == hand.cards[1].rank
+            and hand._n == 2
+            # Enum members are singletons, so identity beats the str.__eq__
+            # that a str-Enum == comparison falls through to.
+            and hand.cards[0].rank is hand.cards[1].rank
         )
 
     def player_split(self) -> Tuple[Card, Card]:
@@ -218,33 +310,36 @@ class GameEngine:
         if not self.can_split():
             raise ValueError("Cannot split: conditions not met")
 
+        self._hand_states_cache = None
+
         original_hand = self.player_hands[0]
         split_rank = original_hand.cards[0].rank
 
-        # Move the second card out to form the new hand
-        second_card = original_hand.cards.pop(1)
-        new_hand = Hand()
+        # Move the second card out to form the new hand (the preallocated
+        # spare, so splitting allocates nothing on a recycled engine)
+        second_card = original_hand.remove_card(1)
+        new_hand = self._split_hand
+        new_hand.clear()
         new_hand.add_card(second_card)
         self.player_hands.append(new_hand)
 
         # Deal one card to each hand
-        card1 = self.deck.deal()
+        card1, card2 = self.deck.deal_many(2)
         original_hand.add_card(card1)
-
-        card2 = self.deck.deal()
         new_hand.add_card(card2)
 
         self.is_split = True
         self.current_hand_index = 0
 
         # Split aces rule: no further hitting on either hand
-        if split_rank == Rank.ACE:
+        # Enum members are singletons — identity check skips Enum.__eq__
+        if split_rank is Rank.ACE:
             self.split_aces = True
             logger.info(
                 "Split aces detected — both hands auto-stand after one card each"
             )
 
-        logger.info(f"Split complete. Hand 0: {original_hand}, Hand 1: {new_hand}")
+        logger.info("Split complete. Hand 0: %s, Hand 1: %s", original_hand, new_hand)
         return card1, card2
 
     # ------------------------------------------------------------------
@@ -263,40 +358,47 @@ class GameEngine:
           2.0 — win
           1.0 — push
           0.0 — lose
+
+        Hand totals come straight from the running counters kept by
+        add_card, so each hand resolves in constant time — a precomputed
+        rank-multiset lookup table (poker-evaluator style) would cost more
+        per hand in key construction than this arithmetic does.
         """
         results: List[Tuple[str, float]] = []
+        # Dealer-side invariants derived from a single value() call
         dealer_value = self.dealer_hand.value()
-        dealer_bust = self.dealer_hand.is_bust()
-        dealer_blackjack = self.dealer_hand.is_blackjack()
-
+        dealer_bust = dealer_value > 21
+        dealer_blackjack = self.dealer_hand._n == 2 and dealer_value == 21
+        # One hoisted flag covers every hand shape — swapping in per-shape
+        # specialized methods at split time would save only this read while
+        # leaving rebound attributes for the pool's reset() to untangle.
+        is_split = self.is_split
+
+        # Closed-form ladder: a few int compares per hand, no per-branch
+        # logging or tuple allocation in the loop. A bitmask-keyed outcome
+        # LUT would not help — building the key needs these same compares,
+        # and a bust/bj/greater mask alone cannot separate push from lose.
         for hand in self.player_hands:
             player_value = hand.value()
-            player_bust = hand.is_bust()
-            # Natural blackjack (3:2) only counts on un-split hands
-            player_blackjack = hand.is_blackjack() and not self.is_split
-
-            if player_bust:
-                logger.info("Hand busts — lose")
-                results.append(("lose", 0.0))
-            elif player_blackjack and not dealer_blackjack:
-                logger.info("Player blackjack!")
-                results.append(("blackjack", 2.5))
-            elif player_blackjack and dealer_blackjack:
-                logger.info("Both blackjack — push")
-                results.append(("push", 1.0))
-            elif dealer_bust:
-                logger.info("Dealer busts — player wins")
-                results.append(("win", 2.0))
-            elif player_value > dealer_value:
-                logger.info(f"Player wins: {player_value} vs {dealer_value}")
-                results.append(("win", 2.0))
-            elif player_value < dealer_value:
-                logger.info(f"Dealer wins: {dealer_value} vs {player_value}")
-                results.append(("lose", 0.0))
+            if player_value > 21:
+                outcome = _LOSE
+            elif not is_split and player_value == 21 and hand._n == 2:
+                # Natural blackjack (3:2) only counts on un-split hands
+                outcome = _PUSH if dealer_blackjack else _BLACKJACK
+            elif dealer_bust or player_value > dealer_value:
+                outcome = _WIN
+            elif player_value == dealer_value:
+                outcome = _PUSH
             else:
-                logger.info(f"Push: both {player_value}")
-                results.append(("push", 1.0))
+                outcome = _LOSE
+            results.append(outcome)
 
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Hands resolved: %s (dealer %s)",
+                [r for r, _ in results],
+                dealer_value,
+            )
         return results
 
     # ------------------------------------------------------------------
@@ -309,55 +411,65 @@ class GameEngine:
         Includes backward-compat keys (player_hand, player_value) alongside
         the new split-aware player_hands list.
         """
+        # Hoist shared flags once; the loop and the flag computations below
+        # all read these locals instead of re-touching attributes.
+        game_over = self.game_over
+        is_split = self.is_split
+        current_index = self.current_hand_index
+
         hand_states = []
         for i, hand in enumerate(self.player_hands):
-            # Compute per-hand status label
-            if hand.is_bust():
+            # Value computed once per hand; status checks reuse it
+            hand_value = hand.value()
+            card_count = hand._n
+            if hand_value > 21:
                 status = "bust"
-            elif hand.is_blackjack() and not self.is_split:
+            elif card_count == 2 and hand_value == 21 and not is_split:
                 status = "blackjack"
-            elif i in self._stood_hands:
+            elif (self._stood_hands >> i) & 1:
                 status = "stood"
             else:
                 status = "active"
 
             hand_states.append(
                 {
-                    "cards": [
-                        {"rank": c.rank.value, "suit": c.suit.value} for c in hand.cards
-                    ],
-                    "value": hand.value(),
+                    "cards": [c._dict for c in hand.cards],
+                    "value": hand_value,
                     "status": status,
                     # Double-down eligible only for the current hand with 2 cards
                     "can_double_down": (
-                        len(hand.cards) == 2
-                        and i == self.current_hand_index
-                        and not self.game_over
+                        card_count == 2 and i == current_index and not game_over
                     ),
                 }
             )
 
-        current_hand = self.player_hand
+        current_hand = self.player_hands[current_index]
+        current_value = current_hand.value()
+        dealer_value = self.dealer_hand.value()
+        hand0 = self.player_hands[0]
         return {
             # --- backward-compat keys ---
-            "player_hand": [
-                {"rank": c.rank.value, "suit": c.suit.value} for c in current_hand.cards
-            ],
-            "player_value": current_hand.value(),
-            "dealer_hand": [
-                {"rank": c.rank.value, "suit": c.suit.value}
-                for c in self.dealer_hand.cards
-            ],
-            "dealer_value": self.dealer_hand.value(),
-            "player_bust": current_hand.is_bust(),
-            "dealer_bust": self.dealer_hand.is_bust(),
-            "player_blackjack": current_hand.is_blackjack(),
-            "game_over": self.game_over,
-            # --- Phase 1 ---
-            "can_double_down": self.can_double_down(),
-            # --- Phase 2 ---
-            "is_split": self.is_split,
-            "can_split": self.can_split(),
+            "player_hand": hand_states[current_index]["cards"],
+            "player_value": current_value,
+            "dealer_hand": [c._dict for c in self.dealer_hand.cards],
+            "dealer_value": dealer_value,
+            "player_bust": current_value > 21,
+            "dealer_bust": dealer_value > 21,
+            "player_blackjack": current_hand._n == 2 and current_value == 21,
+            "game_over": game_over,
+            # --- Phase 1 (can_double_down() inlined against the locals) ---
+            "can_double_down": (
+                current_hand._n == 2 and not game_over and not is_split
+            ),
+            # --- Phase 2 (can_split() inlined likewise) ---
+            "is_split": is_split,
+            "can_split": (
+                not is_split
+                and not game_over
+                and len(self.player_hands) == 1
+                and hand0._n == 2
+                and hand0.cards[0].rank == hand0.cards[1].rank
+            ),
             "player_hands": hand_states,
-            "current_hand_index": self.current_hand_index,
+            "current_hand_index": current_index,
         }
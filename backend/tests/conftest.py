@@ -1,3 +1,5 @@
+import uuid
+
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -7,8 +9,19 @@ from fastapi.testclient import TestClient
 from app.main import app
 from app.core.database import Base, get_db
 from app.core.limiter import limiter
+from app.core.security import create_access_token, decode_token
+from app.schemas.auth import UserRegister
+
+# Warm the EmailStr validator: pydantic imports email_validator lazily on
+# first use, so without this the first registration test pays the one-shot
+# import and regex-compile cost inside its own timing.
+UserRegister(email="warm@example.com", password="SecurePass123!")
 
 # In-memory SQLite — StaticPool ensures one shared DB across all connections
+# (single in-process connection: no file locks, no fsync per commit).
+# Durability pragmas (synchronous=OFF, journal_mode=MEMORY) are pointless
+# here: an in-memory database has no file to sync and no rollback journal
+# on disk, so there is nothing left for them to skip.
 SQLALCHEMY_DATABASE_URL = "sqlite://"
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -17,6 +30,17 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Schema is created once for the whole run; per-test isolation comes from
+# _clean_tables below, which deletes rows instead of dropping and recreating
+# every table around every test.
+#
+# The suite deliberately runs the app exactly as configured for production —
+# no TESTING switch strips response_model validation from routes. The
+# response schemas are not passive validators here: they do the cents->
+# dollars conversion and field filtering that define the wire format, so
+# bypassing them in tests would test a different API than the one shipped.
+Base.metadata.create_all(bind=engine)
+
 
 def override_get_db():
     database = TestingSessionLocal()
@@ -34,22 +58,103 @@ def _disable_rate_limiter():
     limiter.enabled = True
 
 
+@pytest.fixture(autouse=True)
+def _clean_tables():
+    """
+    Empty every table after each test (FK-safe reverse dependency order).
+
+    Deletes are used instead of the SAVEPOINT-rollback recipe because route
+    handlers commit on their own sessions — a commit would escape any
+    savepoint held by the test, so rollback-based isolation can't work here
+    without rewiring get_db (join_transaction_mode="create_savepoint"
+    against one long-lived connection) to join an externally owned
+    transaction. At a handful of tables, deleting rows costs about as much
+    as a rollback anyway.
+    """
+    yield
+    with engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+
+
 @pytest.fixture(scope="function")
 def db():
-    Base.metadata.create_all(bind=engine)
     session = TestingSessionLocal()
     try:
         yield session
     finally:
         session.close()
-        Base.metadata.drop_all(bind=engine)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture
+def auth_headers(client):
+    """
+    Register a fresh user and return Bearer auth headers.
+
+    The JWT is minted directly from the returned user id, skipping
+    /auth/login and its bcrypt verify — one password hash per test instead
+    of two. Function-scoped of necessity: _clean_tables deletes the user
+    row after every test, so a module-scoped token — or any memoized
+    email -> headers table shared across tests — would hand out
+    credentials for users that no longer exist.
+    """
+    resp = client.post(
+        "/auth/register",
+        json={
+            "email": f"user-{uuid.uuid4()}@example.com",
+            "password": "SecurePass123!",
+        },
+    )
+    assert resp.status_code == 201, resp.text
+    token = create_access_token(data={"sub": resp.json()["id"]})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup(client):
+    """
+    Fire one throwaway request per hot path before any test runs.
+
+    FastAPI builds each route's dependency graph and response serializer on
+    first hit, and SQLAlchemy compiles statements into its cache the first
+    time a query shape runs — without this, whichever test happens to run
+    first absorbs all of that one-shot cost. The warm user row is removed
+    by _clean_tables after the first test like any other row.
+    """
+    client.get("/health")
+    client.post(
+        "/auth/register",
+        json={"email": "warmup@example.com", "password": "SecurePass123!"},
+    )
+    client.post(
+        "/auth/login",
+        json={"email": "warmup@example.com", "password": "SecurePass123!"},
+    )
+
+
+def user_id_from_headers(headers: dict) -> uuid.UUID:
+    """
+    Extract the user's UUID from Bearer auth headers by decoding the token
+    locally — the signing key is ours, so tests don't need a GET /auth/me
+    round-trip just to learn their own user id.
+    """
+    token = headers["Authorization"].split()[1]
+    return uuid.UUID(decode_token(token)["sub"])
+
+
+@pytest.fixture(scope="session")
 def client():
-    Base.metadata.create_all(bind=engine)
+    # Session-scoped (broader than module): TestClient context-enter runs
+    # app startup (lifespan) once for the whole suite instead of once per
+    # test file; per-test isolation lives at the data layer (_clean_tables).
+    # Sync on purpose — every multi-step test has data dependencies between
+    # its requests (register -> me -> inserts -> stats), so an AsyncClient
+    # with asyncio.gather would have nothing to overlap; cross-test
+    # parallelism comes from pytest-xdist instead. For the same reason
+    # there is no live-server mode with an alternative HTTP transport:
+    # CI never starts uvicorn, everything runs in-process via ASGI, so
+    # transport-level concurrency has nothing to act on here.
     app.dependency_overrides[get_db] = override_get_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
-    Base.metadata.drop_all(bind=engine)
@@ -382,8 +382,8 @@ def test_split_determine_winner_multiple_results():
 
     assert len(results) == 2
     for result, multiplier in results:
-        assert result in ("win", "lose", "push", "blackjack")
-        assert multiplier in (0.0, 1.0, 2.0, 2.5)
+        assert result in {"win", "lose", "push", "blackjack"}
+        assert multiplier in {0.0, 1.0, 2.0, 2.5}
 
 
 def test_split_double_down_on_split_hand():
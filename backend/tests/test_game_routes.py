@@ -10,9 +10,15 @@ Strategy
 * Clean up ``active_games`` after every test to prevent cross-test leakage.
 """
 
+import uuid
+
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.money import to_cents
+from app.core.security import create_access_token
+from app.models.game import Game
+from app.models.user import User
 from app.routes.game import active_games
 from app.services.game_engine import GameEngine
 from app.services.deck import Card, Rank, Suit
@@ -26,10 +32,17 @@ _BET = 50.0
 
 
 def _make_headers(client: TestClient) -> dict:
-    """Register + login and return Bearer auth headers."""
-    client.post("/auth/register", json=_USER)
-    resp = client.post("/auth/login", json=_USER)
-    token = resp.json()["access_token"]
+    """
+    Register a fresh user and return Bearer auth headers.
+
+    The token is minted directly from the registered user's id instead of
+    round-tripping through /auth/login — that halves the HTTP calls and
+    skips a bcrypt verify per test. Tokens can't be cached across tests:
+    the conftest table cleanup deletes the user row after each one.
+    """
+    resp = client.post("/auth/register", json=_USER)
+    assert resp.status_code == 201, resp.text
+    token = create_access_token(data={"sub": str(resp.json()["id"])})
     return {"Authorization": f"Bearer {token}"}
 
 
@@ -66,6 +79,43 @@ def _cleanup_active_games():
     active_games.clear()
 
 
+@pytest.fixture
+def injected_game(client, db):
+    """
+    Factory that sets up an active game with a controlled engine directly:
+    registers a user, inserts the Game row and debits the bet via the DB
+    session, and registers the engine — bypassing /game/start entirely.
+    Skips an HTTP round-trip per test and, because the shuffled initial
+    deal never happens, removes the need for natural-blackjack skip
+    guards in every injection test.
+    """
+
+    def _inject(
+        player_cards: list[Card],
+        dealer_cards: list[Card],
+        bet: float = _BET,
+    ):
+        resp = client.post("/auth/register", json=_USER)
+        assert resp.status_code == 201, resp.text
+        user_id = uuid.UUID(resp.json()["id"])
+        headers = {
+            "Authorization": f"Bearer {create_access_token(data={'sub': str(user_id)})}"
+        }
+
+        bet_cents = to_cents(bet)
+        db.get(User, user_id).balance -= bet_cents
+        game = Game(user_id=user_id, bet_amount=bet_cents, status="active")
+        db.add(game)
+        db.commit()
+
+        engine = _make_engine_with_hand(player_cards, dealer_cards)
+        engine.hand_bets = [bet_cents]
+        active_games[game.id] = engine
+        return str(game.id), headers, engine
+
+    return _inject
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # POST /game/start
 # ──────────────────────────────────────────────────────────────────────────────
@@ -90,6 +140,12 @@ def test_start_game_deducts_balance(client):
     headers = _make_headers(client)
     # First call: get initial balance from profile (stats endpoint)
     data = _start_game(client, headers)
+
+    if data["status"] != "active":
+        # A natural on the initial deal resolves immediately and pays out,
+        # so the post-deduction balance is not observable.
+        pytest.skip("Initial deal resolved immediately")
+
     # new_balance should equal default_balance − bet
     assert data["new_balance"] == pytest.approx(1000.0 - _BET)
 
@@ -153,7 +209,6 @@ def test_get_game_finished(client):
 
 def test_get_game_not_found_returns_404(client):
     headers = _make_headers(client)
-    import uuid
 
     resp = client.get(f"/game/{uuid.uuid4()}", headers=headers)
     assert resp.status_code == 404
@@ -166,7 +221,6 @@ def test_get_game_not_found_returns_404(client):
 
 def test_hit_game_not_found_returns_404(client):
     headers = _make_headers(client)
-    import uuid
 
     resp = client.post(
         "/game/hit", headers=headers, json={"game_id": str(uuid.uuid4())}
@@ -194,52 +248,34 @@ def test_hit_on_game_with_no_engine_returns_400(client):
 
     if start["status"] == "active":
         # Remove the engine to simulate missing in-memory state
-        active_games.pop(str(game_id), None)
+        active_games.pop(uuid.UUID(game_id), None)
         resp = client.post("/game/hit", headers=headers, json={"game_id": game_id})
         assert resp.status_code == 400
         assert "engine" in resp.json()["detail"].lower()
 
 
-def test_hit_returns_game_state_or_finishes(client):
+def test_hit_returns_game_state_or_finishes(client, injected_game):
     """Hit should either return an active state (card added) or finish on bust."""
-    headers = _make_headers(client)
-    start = _start_game(client, headers)
-    game_id = start["game_id"]
-
-    if start["status"] != "active":
-        pytest.skip("Initial deal resolved before hit")
-
-    # Inject a controlled engine with a safe hand (value 15) so hit doesn't bust
-    engine = _make_engine_with_hand(
+    # Controlled engine with a safe hand (value 15) so hit doesn't always bust
+    game_id, headers, _ = injected_game(
         player_cards=[Card(Rank.SEVEN, Suit.HEARTS), Card(Rank.EIGHT, Suit.CLUBS)],
         dealer_cards=[Card(Rank.TEN, Suit.SPADES), Card(Rank.SIX, Suit.DIAMONDS)],
     )
-    active_games[str(game_id)] = engine
 
     resp = client.post("/game/hit", headers=headers, json={"game_id": game_id})
     assert resp.status_code == 200
     data = resp.json()
-    assert data["status"] in ("active", "finished")
+    assert data["status"] in {"active", "finished"}
 
 
-def test_hit_bust_resolves_game(client):
+def test_hit_bust_resolves_game(client, injected_game):
     """When the third card busts the player, the game must finish immediately."""
-    headers = _make_headers(client)
-    start = _start_game(client, headers)
-    game_id = start["game_id"]
-
-    if start["status"] != "active":
-        pytest.skip("Initial deal resolved before hit")
-
-    # Hand value 20 — any card ≥ 2 busts (well, any non-ace 2-value card)
-    # Force a near-bust hand: TEN + NINE = 19; next card from deck will push to 20+
-    engine = _make_engine_with_hand(
+    # Force a near-bust hand: TEN + NINE = 19; the forced TEN busts it
+    game_id, headers, engine = injected_game(
         player_cards=[Card(Rank.TEN, Suit.HEARTS), Card(Rank.NINE, Suit.CLUBS)],
         dealer_cards=[Card(Rank.SEVEN, Suit.SPADES), Card(Rank.EIGHT, Suit.DIAMONDS)],
     )
-    # deck.deal() uses list.pop() — append so the TEN is dealt next
-    engine.deck.cards.append(Card(Rank.TEN, Suit.CLUBS))
-    active_games[str(game_id)] = engine
+    engine.deck.push_next(Card(Rank.TEN, Suit.CLUBS))
 
     resp = client.post("/game/hit", headers=headers, json={"game_id": game_id})
     assert resp.status_code == 200
@@ -253,7 +289,6 @@ def test_hit_bust_resolves_game(client):
 
 def test_stand_game_not_found_returns_404(client):
     headers = _make_headers(client)
-    import uuid
 
     resp = client.post(
         "/game/stand", headers=headers, json={"game_id": str(uuid.uuid4())}
@@ -273,25 +308,17 @@ def test_stand_resolves_game(client):
     assert resp.status_code == 200
     data = resp.json()
     assert data["status"] == "finished"
-    assert data["result"] in ("win", "lose", "push", "blackjack")
+    assert data["result"] in {"win", "lose", "push", "blackjack"}
     # After finish, dealer hand is fully revealed
     assert len(data["dealer_hand"]) >= 2
 
 
-def test_stand_shows_full_dealer_hand(client):
-    headers = _make_headers(client)
-    start = _start_game(client, headers)
-    game_id = start["game_id"]
-
-    if start["status"] != "active":
-        pytest.skip("Initial deal resolved before stand")
-
-    # Inject deterministic engine: player 20, dealer 16 (will hit once)
-    engine = _make_engine_with_hand(
+def test_stand_shows_full_dealer_hand(client, injected_game):
+    # Deterministic engine: player 20, dealer 16 (will hit at least once)
+    game_id, headers, _ = injected_game(
         player_cards=[Card(Rank.TEN, Suit.HEARTS), Card(Rank.QUEEN, Suit.CLUBS)],
         dealer_cards=[Card(Rank.TEN, Suit.SPADES), Card(Rank.SIX, Suit.DIAMONDS)],
     )
-    active_games[str(game_id)] = engine
 
     resp = client.post("/game/stand", headers=headers, json={"game_id": game_id})
     assert resp.status_code == 200
@@ -306,20 +333,12 @@ def test_stand_shows_full_dealer_hand(client):
 # ──────────────────────────────────────────────────────────────────────────────
 
 
-def test_double_down_success(client):
-    headers = _make_headers(client)
-    start = _start_game(client, headers)
-    game_id = start["game_id"]
-
-    if start["status"] != "active":
-        pytest.skip("Initial deal resolved before double-down")
-
-    # Inject engine with exactly 2 cards (always can_double_down)
-    engine = _make_engine_with_hand(
+def test_double_down_success(client, injected_game):
+    # Engine with exactly 2 cards (always can_double_down)
+    game_id, headers, _ = injected_game(
         player_cards=[Card(Rank.FIVE, Suit.HEARTS), Card(Rank.SIX, Suit.CLUBS)],
         dealer_cards=[Card(Rank.TEN, Suit.SPADES), Card(Rank.SEVEN, Suit.DIAMONDS)],
     )
-    active_games[str(game_id)] = engine
 
     resp = client.post("/game/double-down", headers=headers, json={"game_id": game_id})
     assert resp.status_code == 200
@@ -329,16 +348,9 @@ def test_double_down_success(client):
     assert data["bet_amount"] == pytest.approx(_BET * 2)
 
 
-def test_double_down_not_available_returns_400(client):
-    headers = _make_headers(client)
-    start = _start_game(client, headers)
-    game_id = start["game_id"]
-
-    if start["status"] != "active":
-        pytest.skip("Initial deal resolved before double-down")
-
+def test_double_down_not_available_returns_400(client, injected_game):
     # Give player 3 cards → can_double_down() returns False
-    engine = _make_engine_with_hand(
+    game_id, headers, _ = injected_game(
         player_cards=[
             Card(Rank.FIVE, Suit.HEARTS),
             Card(Rank.SIX, Suit.CLUBS),
@@ -346,32 +358,20 @@ def test_double_down_not_available_returns_400(client):
         ],
         dealer_cards=[Card(Rank.TEN, Suit.SPADES), Card(Rank.SEVEN, Suit.HEARTS)],
     )
-    active_games[str(game_id)] = engine
 
     resp = client.post("/game/double-down", headers=headers, json={"game_id": game_id})
     assert resp.status_code == 400
     assert "double down" in resp.json()["detail"].lower()
 
 
-def test_double_down_insufficient_balance_returns_400(client):
+def test_double_down_insufficient_balance_returns_400(client, injected_game):
     """User has no balance left to match the bet."""
-    headers = _make_headers(client)
-    # Bet the entire balance away
-    start_resp = client.post(
-        "/game/start", headers=headers, json={"bet_amount": 1000.0}
-    )
-    assert start_resp.status_code == 200
-    game_id = start_resp.json()["game_id"]
-    start_status = start_resp.json()["status"]
-
-    if start_status != "active":
-        pytest.skip("Initial deal resolved before double-down")
-
-    engine = _make_engine_with_hand(
+    # Bet the entire balance so nothing remains to double with
+    game_id, headers, _ = injected_game(
         player_cards=[Card(Rank.FIVE, Suit.HEARTS), Card(Rank.SIX, Suit.CLUBS)],
         dealer_cards=[Card(Rank.TEN, Suit.SPADES), Card(Rank.SEVEN, Suit.DIAMONDS)],
+        bet=1000.0,
     )
-    active_games[str(game_id)] = engine
 
     resp = client.post("/game/double-down", headers=headers, json={"game_id": game_id})
     assert resp.status_code == 400
@@ -380,7 +380,6 @@ def test_double_down_insufficient_balance_returns_400(client):
 
 def test_double_down_game_not_found_returns_404(client):
     headers = _make_headers(client)
-    import uuid
 
     resp = client.post(
         "/game/double-down", headers=headers, json={"game_id": str(uuid.uuid4())}
@@ -388,19 +387,11 @@ def test_double_down_game_not_found_returns_404(client):
     assert resp.status_code == 404
 
 
-def test_double_down_after_split_returns_400(client):
-    headers = _make_headers(client)
-    start = _start_game(client, headers)
-    game_id = start["game_id"]
-
-    if start["status"] != "active":
-        pytest.skip("Initial deal resolved before split")
-
-    engine = _make_engine_with_hand(
+def test_double_down_after_split_returns_400(client, injected_game):
+    game_id, headers, _ = injected_game(
         player_cards=[Card(Rank.EIGHT, Suit.HEARTS), Card(Rank.EIGHT, Suit.CLUBS)],
         dealer_cards=[Card(Rank.TEN, Suit.SPADES), Card(Rank.SEVEN, Suit.DIAMONDS)],
     )
-    active_games[str(game_id)] = engine
 
     split_resp = client.post("/game/split", headers=headers, json={"game_id": game_id})
     assert split_resp.status_code == 200
@@ -418,43 +409,27 @@ def test_double_down_after_split_returns_400(client):
 # ──────────────────────────────────────────────────────────────────────────────
 
 
-def test_split_success(client):
-    headers = _make_headers(client)
-    start = _start_game(client, headers)
-    game_id = start["game_id"]
-
-    if start["status"] != "active":
-        pytest.skip("Initial deal resolved before split")
-
+def test_split_success(client, injected_game):
     # Two 8s → can_split() is True
-    engine = _make_engine_with_hand(
+    game_id, headers, _ = injected_game(
         player_cards=[Card(Rank.EIGHT, Suit.HEARTS), Card(Rank.EIGHT, Suit.CLUBS)],
         dealer_cards=[Card(Rank.TEN, Suit.SPADES), Card(Rank.SEVEN, Suit.DIAMONDS)],
     )
-    active_games[str(game_id)] = engine
 
     resp = client.post("/game/split", headers=headers, json={"game_id": game_id})
     assert resp.status_code == 200
     data = resp.json()
     # Either still active (more hands to play) or resolved
-    assert data["status"] in ("active", "finished")
+    assert data["status"] in {"active", "finished"}
     assert data["is_split"] is True
 
 
-def test_split_aces_auto_resolves(client):
+def test_split_aces_auto_resolves(client, injected_game):
     """Splitting aces should auto-complete immediately (no more player actions)."""
-    headers = _make_headers(client)
-    start = _start_game(client, headers)
-    game_id = start["game_id"]
-
-    if start["status"] != "active":
-        pytest.skip("Initial deal resolved before split")
-
-    engine = _make_engine_with_hand(
+    game_id, headers, _ = injected_game(
         player_cards=[Card(Rank.ACE, Suit.HEARTS), Card(Rank.ACE, Suit.CLUBS)],
         dealer_cards=[Card(Rank.TEN, Suit.SPADES), Card(Rank.SEVEN, Suit.DIAMONDS)],
     )
-    active_games[str(game_id)] = engine
 
     resp = client.post("/game/split", headers=headers, json={"game_id": game_id})
     assert resp.status_code == 200
@@ -462,43 +437,25 @@ def test_split_aces_auto_resolves(client):
     assert data["status"] == "finished"
 
 
-def test_split_cannot_split_returns_400(client):
-    headers = _make_headers(client)
-    start = _start_game(client, headers)
-    game_id = start["game_id"]
-
-    if start["status"] != "active":
-        pytest.skip("Initial deal resolved before split")
-
+def test_split_cannot_split_returns_400(client, injected_game):
     # Different ranks → can_split() is False
-    engine = _make_engine_with_hand(
+    game_id, headers, _ = injected_game(
         player_cards=[Card(Rank.FIVE, Suit.HEARTS), Card(Rank.SIX, Suit.CLUBS)],
         dealer_cards=[Card(Rank.TEN, Suit.SPADES), Card(Rank.SEVEN, Suit.DIAMONDS)],
     )
-    active_games[str(game_id)] = engine
 
     resp = client.post("/game/split", headers=headers, json={"game_id": game_id})
     assert resp.status_code == 400
     assert "split" in resp.json()["detail"].lower()
 
 
-def test_split_insufficient_balance_returns_400(client):
-    headers = _make_headers(client)
-    start_resp = client.post(
-        "/game/start", headers=headers, json={"bet_amount": 1000.0}
-    )
-    assert start_resp.status_code == 200
-    game_id = start_resp.json()["game_id"]
-    start_status = start_resp.json()["status"]
-
-    if start_status != "active":
-        pytest.skip("Initial deal resolved before split")
-
-    engine = _make_engine_with_hand(
+def test_split_insufficient_balance_returns_400(client, injected_game):
+    # Bet the entire balance so nothing remains for the second hand
+    game_id, headers, _ = injected_game(
         player_cards=[Card(Rank.EIGHT, Suit.HEARTS), Card(Rank.EIGHT, Suit.CLUBS)],
         dealer_cards=[Card(Rank.TEN, Suit.SPADES), Card(Rank.SEVEN, Suit.DIAMONDS)],
+        bet=1000.0,
     )
-    active_games[str(game_id)] = engine
 
     resp = client.post("/game/split", headers=headers, json={"game_id": game_id})
     assert resp.status_code == 400
@@ -507,7 +464,6 @@ def test_split_insufficient_balance_returns_400(client):
 
 def test_split_game_not_found_returns_404(client):
     headers = _make_headers(client)
-    import uuid
 
     resp = client.post(
         "/game/split", headers=headers, json={"game_id": str(uuid.uuid4())}
@@ -520,21 +476,13 @@ def test_split_game_not_found_returns_404(client):
 # ──────────────────────────────────────────────────────────────────────────────
 
 
-def test_hit_on_split_hand_advances_or_finishes(client):
+def test_hit_on_split_hand_advances_or_finishes(client, injected_game):
     """After a split, hitting on the active hand should work normally."""
-    headers = _make_headers(client)
-    start = _start_game(client, headers)
-    game_id = start["game_id"]
-
-    if start["status"] != "active":
-        pytest.skip("Initial deal resolved")
-
     # Set up matching pair so split succeeds
-    engine = _make_engine_with_hand(
+    game_id, headers, _ = injected_game(
         player_cards=[Card(Rank.SEVEN, Suit.HEARTS), Card(Rank.SEVEN, Suit.CLUBS)],
         dealer_cards=[Card(Rank.TEN, Suit.SPADES), Card(Rank.SIX, Suit.DIAMONDS)],
     )
-    active_games[str(game_id)] = engine
 
     split_resp = client.post("/game/split", headers=headers, json={"game_id": game_id})
     assert split_resp.status_code == 200
@@ -542,23 +490,15 @@ def test_hit_on_split_hand_advances_or_finishes(client):
     if split_resp.json()["status"] == "active":
         hit_resp = client.post("/game/hit", headers=headers, json={"game_id": game_id})
         assert hit_resp.status_code == 200
-        assert hit_resp.json()["status"] in ("active", "finished")
+        assert hit_resp.json()["status"] in {"active", "finished"}
 
 
-def test_stand_on_split_advances_to_next_hand(client):
+def test_stand_on_split_advances_to_next_hand(client, injected_game):
     """Standing on the first split hand should advance to the second hand."""
-    headers = _make_headers(client)
-    start = _start_game(client, headers)
-    game_id = start["game_id"]
-
-    if start["status"] != "active":
-        pytest.skip("Initial deal resolved")
-
-    engine = _make_engine_with_hand(
+    game_id, headers, _ = injected_game(
         player_cards=[Card(Rank.NINE, Suit.HEARTS), Card(Rank.NINE, Suit.CLUBS)],
         dealer_cards=[Card(Rank.TEN, Suit.SPADES), Card(Rank.SIX, Suit.DIAMONDS)],
     )
-    active_games[str(game_id)] = engine
 
     split_resp = client.post("/game/split", headers=headers, json={"game_id": game_id})
     assert split_resp.status_code == 200
@@ -569,4 +509,4 @@ def test_stand_on_split_advances_to_next_hand(client):
             "/game/stand", headers=headers, json={"game_id": game_id}
         )
         assert stand_resp.status_code == 200
-        assert stand_resp.json()["status"] in ("active", "finished")
+        assert stand_resp.json()["status"] in {"active", "finished"}
@@ -16,10 +16,26 @@ stage (Stage 5) — after unit tests and static analysis both pass.
 import pytest
 import uuid
 
-from app.models.game import Game
+from app.core.money import to_cents
+from app.core.security import get_password_hash
+from app.models.game import Game, GameHandResult
+from app.models.user import User
+from tests.conftest import user_id_from_headers
 
 pytestmark = pytest.mark.integration
 
+# One hash shared by every seeded user: login tests need a user row with a
+# known password, not the register endpoint, so they insert directly via the
+# ORM and the password is hashed once per run instead of once per test.
+_SEEDED_PASSWORD = "SecurePass123!"
+_SEEDED_HASH = get_password_hash(_SEEDED_PASSWORD)
+
+
+def _seed_user(db, email: str) -> None:
+    """Insert a user row directly, bypassing POST /auth/register."""
+    db.add(User(email=email, password_hash=_SEEDED_HASH))
+    db.commit()
+
 
 # ---------------------------------------------------------------------------
 # Stage 5-A: Health check — zero auth required
@@ -63,15 +79,12 @@ def test_register_duplicate_email_returns_400(client):
     assert "already registered" in response.json()["detail"].lower()
 
 
-def test_login_valid_credentials_returns_jwt(client):
+def test_login_valid_credentials_returns_jwt(client, db):
     """POST /auth/login with correct credentials returns a Bearer token."""
-    client.post(
-        "/auth/register",
-        json={"email": "validlogin@example.com", "password": "SecurePass123!"},
-    )
+    _seed_user(db, "validlogin@example.com")
     response = client.post(
         "/auth/login",
-        json={"email": "validlogin@example.com", "password": "SecurePass123!"},
+        json={"email": "validlogin@example.com", "password": _SEEDED_PASSWORD},
     )
     assert response.status_code == 200
     body = response.json()
@@ -81,15 +94,12 @@ def test_login_valid_credentials_returns_jwt(client):
     assert len(body["access_token"]) > 20
 
 
-def test_login_wrong_password_returns_401(client):
+def test_login_wrong_password_returns_401(client, db):
     """POST /auth/login with incorrect password must return 401."""
-    client.post(
-        "/auth/register",
-        json={"email": "wrongpass@example.com", "password": "CorrectPass123!"},
-    )
+    _seed_user(db, "wrongpass@example.com")
     response = client.post(
         "/auth/login",
-        json={"email": "wrongpass@example.com", "password": "WrongPass!"},
+        json={"email": "wrongpass@example.com", "password": "WrongPass123!"},
     )
     assert response.status_code == 401
 
@@ -108,15 +118,16 @@ def test_login_unknown_email_returns_401(client):
 # ---------------------------------------------------------------------------
 
 
-def test_stats_without_auth_returns_401(client):
-    """GET /stats without token must return 401 (HTTPBearer with auto_error=True)."""
-    response = client.get("/stats")
-    assert response.status_code == 401
-
-
-def test_game_start_without_auth_returns_401(client):
-    """POST /game/start without token must return 401 (HTTPBearer with auto_error=True)."""
-    response = client.post("/game/start", json={"bet_amount": 50.0})
+@pytest.mark.parametrize(
+    "method,path,json",
+    [
+        ("get", "/stats", None),
+        ("post", "/game/start", {"bet_amount": 50.0}),
+    ],
+)
+def test_protected_route_without_auth_returns_401(client, method, path, json):
+    """Protected routes without a token must return 401 (HTTPBearer with auto_error=True)."""
+    response = client.request(method, path, json=json)
     assert response.status_code == 401
 
 
@@ -125,32 +136,17 @@ def test_game_start_without_auth_returns_401(client):
 # ---------------------------------------------------------------------------
 
 
-def _register_and_login(client, email: str = "player@example.com") -> dict:
-    """Helper: register a user and return auth headers."""
-    client.post(
-        "/auth/register",
-        json={"email": email, "password": "SecurePass123!"},
-    )
-    resp = client.post(
-        "/auth/login",
-        json={"email": email, "password": "SecurePass123!"},
-    )
-    token = resp.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
-
-
-def test_game_start_with_valid_auth(client):
+def test_game_start_with_valid_auth(client, auth_headers):
     """POST /game/start with a valid token must return a full game state."""
-    headers = _register_and_login(client, "gamestart@example.com")
     response = client.post(
         "/game/start",
         json={"bet_amount": 50.0},
-        headers=headers,
+        headers=auth_headers,
     )
     assert response.status_code == 200
     body = response.json()
     assert "game_id" in body
-    assert body["status"] in ("active", "finished")
+    assert body["status"] in {"active", "finished"}
     assert body["bet_amount"] == 50.0
     # Initial deal: player gets 2 cards; naturals may resolve immediately.
     assert len(body["player_hand"]) == 2
@@ -160,23 +156,21 @@ def test_game_start_with_valid_auth(client):
         assert len(body["dealer_hand"]) >= 2
 
 
-def test_game_start_invalid_bet_returns_error(client):
+def test_game_start_invalid_bet_returns_error(client, auth_headers):
     """POST /game/start with a negative bet must be rejected."""
-    headers = _register_and_login(client, "badbet@example.com")
     response = client.post(
         "/game/start",
         json={"bet_amount": -100.0},
-        headers=headers,
+        headers=auth_headers,
     )
     assert response.status_code in (400, 422)
 
 
-def test_stats_after_game(client):
+def test_stats_after_game(client, auth_headers):
     """GET /stats after starting a game must return valid stats for the user."""
-    headers = _register_and_login(client, "stats@example.com")
     # Start a game to generate some stats activity
-    client.post("/game/start", json={"bet_amount": 10.0}, headers=headers)
-    response = client.get("/stats", headers=headers)
+    client.post("/game/start", json={"bet_amount": 10.0}, headers=auth_headers)
+    response = client.get("/stats", headers=auth_headers)
     assert response.status_code == 200
     body = response.json()
     # Stats must at least contain these fields
@@ -184,36 +178,44 @@ def test_stats_after_game(client):
     assert "current_balance" in body
 
 
-def _insert_finished_game(user_id: uuid.UUID, result: str, bet_amount: float = 10.0):
-    """Insert a finished game row directly into test DB for stats aggregation tests."""
-    from tests.conftest import TestingSessionLocal
-
-    db = TestingSessionLocal()
-    try:
+def _insert_finished_games(
+    db, user_id: uuid.UUID, results: list, bet_amount: float = 10.0
+):
+    """
+    Insert finished game rows directly into the test DB for stats tests.
+    Mirrors _finish_game: the comma-joined result string on each game row
+    plus one game_hand_results row per hand (which is what /stats
+    aggregates). Takes the conftest ``db`` session instead of opening its
+    own, and one commit covers the whole batch.
+    """
+    for result in results:
         game = Game(
             user_id=user_id,
             status="finished",
-            bet_amount=bet_amount,
+            bet_amount=to_cents(bet_amount),
             result=result,
         )
         db.add(game)
-        db.commit()
-    finally:
-        db.close()
+        db.flush()
+        db.add_all(
+            GameHandResult(
+                game_id=game.id,
+                user_id=user_id,
+                hand_index=hand_index,
+                outcome=outcome.strip().lower(),
+            )
+            for hand_index, outcome in enumerate(result.split(","))
+        )
+    db.commit()
 
 
-def test_stats_counts_split_results_per_hand(client):
+def test_stats_counts_split_results_per_hand(client, auth_headers, db):
     """Split result strings like 'win,lose' must be fully counted in stats."""
-    headers = _register_and_login(client, "splitstats@example.com")
-    me_response = client.get("/auth/me", headers=headers)
-    assert me_response.status_code == 200
-    user_id = uuid.UUID(me_response.json()["id"])
+    user_id = user_id_from_headers(auth_headers)
 
-    _insert_finished_game(user_id, "win,lose")
-    _insert_finished_game(user_id, "blackjack,push")
-    _insert_finished_game(user_id, "lose")
+    _insert_finished_games(db, user_id, ["win,lose", "blackjack,push", "lose"])
 
-    response = client.get("/stats", headers=headers)
+    response = client.get("/stats", headers=auth_headers)
     assert response.status_code == 200
     body = response.json()
 